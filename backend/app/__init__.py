@@ -1,12 +1,50 @@
 # PyPNM Web GUI - Flask Application
 # SPDX-License-Identifier: Apache-2.0
 
+import atexit
+import logging
+import logging.handlers
+import queue
+
 from flask import Flask, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider using orjson when installed (large base64 plot payloads encode much faster)."""
+    
+    # Config DEBUG defaults to True, which would pretty-print every API response
+    compact = True
+    # Keep dict insertion order instead of sorting every object's keys per response
+    sort_keys = False
+    
+    def dumps(self, obj, **kwargs):
+        # Pretty-printing (debug mode) goes through the default provider;
+        # orjson output is always compact, matching the default separators
+        if orjson is None or kwargs.get('indent'):
+            return super().dumps(obj, **kwargs)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        # orjson.JSONDecodeError subclasses ValueError, so request.get_json()
+        # still reports malformed bodies as 400
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
 
 class CustomFlask(Flask):
     """Custom Flask class with modified Jinja2 delimiters for Vue.js compatibility."""
+    json_provider_class = OrjsonProvider
     jinja_options = Flask.jinja_options.copy()
     jinja_options.update(dict(
         variable_start_string='[[',
@@ -17,13 +55,50 @@ class CustomFlask(Flask):
 # Global websocket instance
 sock = None
 
+# Background thread writing queued log records to the original root handlers
+log_listener = None
+
 
 import os
 
+
+def _queue_root_logging():
+    """
+    Put the root logger's handlers behind a QueueHandler so request threads
+    only enqueue records; a QueueListener formats and writes them. Sets up a
+    stderr handler first unless the server already configured one.
+    """
+    global log_listener
+    
+    if log_listener is not None:
+        return
+    
+    root = logging.getLogger()
+    if not root.handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+    
+    handlers = root.handlers[:]
+    for handler in handlers:
+        root.removeHandler(handler)
+    
+    # queue.Queue rather than SimpleQueue: its locks are green under eventlet,
+    # so the listener's blocking get() does not stall the hub
+    log_queue = queue.Queue(-1)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+
 def create_app():
     """Create and configure the Flask application."""
     global sock
     
+    _queue_root_logging()
+    
     # Paths work for both local dev and Docker
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     frontend_dir = os.path.join(base_dir, '..', 'frontend')
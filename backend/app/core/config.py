@@ -24,6 +24,13 @@ class Config:
     TFTP_IPV6 = os.environ.get('TFTP_IPV6', '')
     TFTP_PATH = os.environ.get('TFTP_PATH', '/tftpboot')
     
+    # Archive downloads: when nginx fronts the app, set to the internal location
+    # aliased to /app/data (e.g. '/internal/data/') so nginx sends the file itself
+    ARCHIVE_ACCEL_REDIRECT_PREFIX = os.environ.get('ARCHIVE_ACCEL_REDIRECT_PREFIX', '')
+    # Behind Apache (mod_xsendfile) or lighttpd: send_file emits an X-Sendfile header
+    # with the file path and an empty body, and the server sends the file itself
+    USE_X_SENDFILE = os.environ.get('USE_X_SENDFILE', 'False').lower() == 'true'
+    
     # Data source mode: 'mock', 'agent', or 'direct'
     # - mock: Use mock data (for development/demo)
     # - agent: Use remote agent via WebSocket
@@ -0,0 +1,99 @@
+# PyPNM Web GUI - Lightweight file stat helper
+# SPDX-License-Identifier: Apache-2.0
+#
+# statx(2) wrapper that asks the kernel only for type, size and mtime and
+# allows cached attributes (AT_STATX_DONT_SYNC) on network/mounted volumes.
+# Falls back to os.stat where statx is not available.
+
+import ctypes
+import ctypes.util
+import functools
+import os
+import platform
+import stat
+from typing import Tuple
+
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+AT_STATX_DONT_SYNC = 0x4000
+
+STATX_TYPE = 0x0001
+STATX_MTIME = 0x0040
+STATX_SIZE = 0x0200
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ('tv_sec', ctypes.c_int64),
+        ('tv_nsec', ctypes.c_uint32),
+        ('__reserved', ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    """struct statx from <linux/stat.h> (256 bytes)."""
+    _fields_ = [
+        ('stx_mask', ctypes.c_uint32),
+        ('stx_blksize', ctypes.c_uint32),
+        ('stx_attributes', ctypes.c_uint64),
+        ('stx_nlink', ctypes.c_uint32),
+        ('stx_uid', ctypes.c_uint32),
+        ('stx_gid', ctypes.c_uint32),
+        ('stx_mode', ctypes.c_uint16),
+        ('__spare0', ctypes.c_uint16),
+        ('stx_ino', ctypes.c_uint64),
+        ('stx_size', ctypes.c_uint64),
+        ('stx_blocks', ctypes.c_uint64),
+        ('stx_attributes_mask', ctypes.c_uint64),
+        ('stx_atime', _StatxTimestamp),
+        ('stx_btime', _StatxTimestamp),
+        ('stx_ctime', _StatxTimestamp),
+        ('stx_mtime', _StatxTimestamp),
+        ('stx_rdev_major', ctypes.c_uint32),
+        ('stx_rdev_minor', ctypes.c_uint32),
+        ('stx_dev_major', ctypes.c_uint32),
+        ('stx_dev_minor', ctypes.c_uint32),
+        ('__spare2', ctypes.c_uint64 * 14),
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _statx_func():
+    """Return libc's statx() if this is Linux >= 4.11 with glibc >= 2.28, else None."""
+    if platform.system() != 'Linux':
+        return None
+    try:
+        major, minor = (int(part) for part in platform.release().split('.')[:2])
+    except ValueError:
+        return None
+    if (major, minor) < (4, 11):
+        return None
+    
+    libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    func = getattr(libc, 'statx', None)
+    if func is None:
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.POINTER(_Statx)]
+    func.restype = ctypes.c_int
+    return func
+
+
+def stat_mtime_size(path: str) -> Tuple[float, int, bool]:
+    """
+    Return (st_mtime, st_size, is_regular_file) for path without following symlinks.
+    
+    Raises OSError like os.stat.
+    """
+    func = _statx_func()
+    if func is None:
+        st = os.stat(path, follow_symlinks=False)
+        return st.st_mtime, st.st_size, stat.S_ISREG(st.st_mode)
+    
+    buf = _Statx()
+    if func(AT_FDCWD, os.fsencode(path), AT_SYMLINK_NOFOLLOW | AT_STATX_DONT_SYNC,
+            STATX_TYPE | STATX_MTIME | STATX_SIZE, ctypes.byref(buf)) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), path)
+    
+    mtime = buf.stx_mtime.tv_sec + buf.stx_mtime.tv_nsec / 1e9
+    return mtime, buf.stx_size, stat.S_ISREG(buf.stx_mode)
@@ -0,0 +1,30 @@
+# PyPNM Web GUI - Shared route defaults
+# SPDX-License-Identifier: Apache-2.0
+#
+# SNMP community defaults (lab or production) and the channel-stats worker
+# pool, shared by the API and PyPNM route modules.
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# PYPNM_MODE is read once at import rather than on every community lookup
+PYPNM_LAB_MODE = os.environ.get('PYPNM_MODE') == 'lab'
+
+
+def get_default_community():
+    """Get default SNMP community for modems based on mode."""
+    return 'z1gg0m0n1t0r1ng' if PYPNM_LAB_MODE else 'm0d3m1nf0'
+
+
+def get_default_write_community():
+    """Get default SNMP write community for modem PNM operations (SET)."""
+    return 'z1gg0m0n1t0r1ng' if PYPNM_LAB_MODE else 'private'
+
+
+def get_cmts_community():
+    """Get default SNMP community for CMTS operations."""
+    return 'Z1gg0Sp3c1@l' if PYPNM_LAB_MODE else 'private'
+
+
+# Runs the per-request channel stat fetches concurrently (4 per request)
+channel_stats_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='channel-stats')
@@ -6,7 +6,10 @@
 import os
 import json
 import logging
+import tempfile
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any, List, Union
 from dataclasses import dataclass
 
@@ -21,10 +24,22 @@ class PyPNMConfig:
     base_url: str = None
     timeout: int = 180
     verify_ssl: bool = False
+    # Directory archive downloads are streamed into (falls back to system temp dir)
+    archive_dir: str = None
     
     def __post_init__(self):
         if self.base_url is None:
             self.base_url = os.environ.get('PYPNM_API_URL', os.environ.get('PYPNM_BASE_URL', 'http://172.17.0.1:8081'))
+        if self.archive_dir is None:
+            self.archive_dir = os.environ.get('PYPNM_ARCHIVE_DIR', '/app/data')
+
+
+@dataclass
+class ArchiveDownload:
+    """Binary archive response from PyPNM, streamed to a local file."""
+    path: str
+    size: int
+    head: bytes  # Leading bytes of the archive, for type detection (ZIP magic, JSON)
 
 
 class PyPNMClient:
@@ -42,6 +57,10 @@ class PyPNMClient:
         self.config = config or PyPNMConfig()
         self.session = requests.Session()
         self.session.verify = self.config.verify_ssl
+        # Keep-alive pool sized for concurrent Flask requests sharing this client
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         logger.info(f"PyPNM client initialized: {self.config.base_url}")
     
     def _build_cable_modem_request(
@@ -80,19 +99,23 @@ class PyPNMClient:
         
         return payload
     
-    def _post(self, endpoint: str, payload: Dict[str, Any], expect_binary: bool = False) -> Union[Dict[str, Any], bytes]:
+    def _post(self, endpoint: str, payload: Dict[str, Any], expect_binary: bool = False) -> Union[Dict[str, Any], ArchiveDownload]:
         """Make POST request to PyPNM API."""
         url = f"{self.config.base_url}{endpoint}"
         
         # Spectrum analyzer needs longer timeout (full frequency sweep 300-1218 MHz)
         timeout = 300 if 'spectrumAnalyzer' in endpoint else self.config.timeout
         
+        # Archive responses are streamed straight to disk instead of buffered in memory
+        want_archive = expect_binary or payload.get('analysis', {}).get('output', {}).get('type') == 'archive'
+        
         try:
             logger.debug(f"POST {url} with payload: {payload}")
             response = self.session.post(
                 url,
                 json=payload,
-                timeout=timeout
+                timeout=timeout,
+                stream=want_archive
             )
             
             # Log PyPNM errors
@@ -111,31 +134,9 @@ class PyPNMClient:
             
             response.raise_for_status()
             
-            # For archive responses, return binary content
-            if expect_binary or payload.get('analysis', {}).get('output', {}).get('type') == 'archive':
-                content_len = len(response.content)
-                content_type = response.headers.get('content-type', '')
-                logger.info(f"PyPNM returned {content_len} bytes, Content-Type: {content_type}")
-                
-                # Check if response is actually JSON (error response) vs binary archive
-                # PyPNM may return JSON error even when archive was requested
-                if 'application/json' in content_type or (content_len < 1000 and response.content.startswith(b'{')):
-                    try:
-                        json_response = response.json()
-                        # Check if it's an error response (status != 0)
-                        if isinstance(json_response, dict) and json_response.get('status', 0) != 0:
-                            logger.error(f"PyPNM returned error: {json_response}")
-                            return json_response
-                        return json_response
-                    except Exception as e:
-                        logger.warning(f"Response looks like JSON but failed to parse: {e}")
-                
-                if content_len == 0:
-                    logger.error("PyPNM returned empty content for archive request!")
-                # Log first 200 bytes if not binary
-                if content_len > 0 and content_len < 1000:
-                    logger.warning(f"Small response ({content_len} bytes): {response.content[:200]}")
-                return response.content
+            # For archive responses, return the downloaded file
+            if want_archive:
+                return self._save_archive(response)
             
             return response.json()
         
@@ -169,6 +170,57 @@ class PyPNMClient:
                 "message": f"Unexpected error: {str(e)}"
             }
     
+    def _save_archive(self, response: requests.Response) -> Union[Dict[str, Any], ArchiveDownload]:
+        """Stream an archive response body to disk in 1 MiB chunks."""
+        content_type = response.headers.get('content-type', '')
+        
+        # PyPNM may return JSON error even when archive was requested
+        if 'application/json' in content_type:
+            try:
+                json_response = response.json()
+                if isinstance(json_response, dict) and json_response.get('status', 0) != 0:
+                    logger.error(f"PyPNM returned error: {json_response}")
+                return json_response
+            except Exception as e:
+                logger.warning(f"Response looks like JSON but failed to parse: {e}")
+        
+        archive_dir = self.config.archive_dir if os.path.isdir(self.config.archive_dir) else None
+        fd, path = tempfile.mkstemp(prefix='pypnm_', suffix='.part', dir=archive_dir)
+        head = b''
+        size = 0
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    if not head:
+                        head = chunk[:1000]
+                    f.write(chunk)
+                    size += len(chunk)
+        except Exception:
+            os.unlink(path)
+            raise
+        finally:
+            response.close()
+        
+        logger.info(f"PyPNM returned {size} bytes, Content-Type: {content_type}")
+        
+        # Check if a small response is actually JSON (error response) vs binary archive
+        if size < 1000 and head.startswith(b'{'):
+            try:
+                json_response = json.loads(head)
+                os.unlink(path)
+                if isinstance(json_response, dict) and json_response.get('status', 0) != 0:
+                    logger.error(f"PyPNM returned error: {json_response}")
+                return json_response
+            except ValueError as e:
+                logger.warning(f"Response looks like JSON but failed to parse: {e}")
+        
+        if size == 0:
+            logger.error("PyPNM returned empty content for archive request!")
+        # Log first 200 bytes if not binary
+        if 0 < size < 1000:
+            logger.warning(f"Small response ({size} bytes): {head[:200]}")
+        return ArchiveDownload(path=path, size=size, head=head)
+    
     # ============== System Information Endpoints ==============
     
     def get_sys_descr(self, mac_address: str, ip_address: str, 
@@ -706,13 +758,16 @@ class PyPNMClient:
             return False
 
 
-# Global PyPNM client instance
+# Global PyPNM client instance (its requests.Session pool is safe to share across threads)
 _pypnm_client: Optional[PyPNMClient] = None
+_pypnm_client_lock = threading.Lock()
 
 
 def get_pypnm_client() -> PyPNMClient:
     """Get or create global PyPNM client instance."""
     global _pypnm_client
     if _pypnm_client is None:
-        _pypnm_client = PyPNMClient()
+        with _pypnm_client_lock:
+            if _pypnm_client is None:
+                _pypnm_client = PyPNMClient()
     return _pypnm_client
@@ -14,6 +14,9 @@ from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# How long a finished task result is kept for pollers after its own timeout
+TASK_RESULT_TTL = 300
+
 
 @dataclass
 class PendingTask:
@@ -48,6 +51,8 @@ class SimpleAgentManager:
         self.pending_tasks: dict[str, PendingTask] = {}
         self.auth_token = auth_token
         self._task_queues: dict[str, Queue] = {}
+        # capability -> agent, cleared whenever an agent registers or disconnects
+        self._capability_cache: dict[str, Optional[ConnectedAgent]] = {}
         self.logger = logging.getLogger(f'{__name__}.AgentManager')
     
     def handle_message(self, ws, message: str, agent_id: str = None) -> Optional[str]:
@@ -101,6 +106,7 @@ class SimpleAgentManager:
             authenticated=True
         )
         self.agents[agent_id] = agent
+        self._capability_cache = {}
         
         self.logger.info(f"Agent authenticated: {agent_id} with {capabilities}")
         return json.dumps({
@@ -158,6 +164,7 @@ class SimpleAgentManager:
         
         if to_remove:
             del self.agents[to_remove]
+            self._capability_cache = {}
             self.logger.info(f"Agent disconnected: {to_remove}")
     
     def get_available_agents(self) -> list:
@@ -175,11 +182,22 @@ class SimpleAgentManager:
         ]
     
     def get_agent_for_capability(self, capability: str) -> Optional[ConnectedAgent]:
-        """Find agent with required capability."""
-        for agent in self.agents.values():
+        """Find agent with required capability (memoized until the agent set changes)."""
+        try:
+            return self._capability_cache[capability]
+        except KeyError:
+            pass
+        
+        cache = self._capability_cache
+        found = None
+        for agent in list(self.agents.values()):
             if agent.authenticated and capability in agent.capabilities:
-                return agent
-        return None
+                found = agent
+                break
+        # Skip storing if the agent set changed (cache replaced) while scanning
+        if cache is self._capability_cache:
+            cache[capability] = found
+        return found
     
     def send_task(self, agent_id: str, command: str, params: dict, timeout: float = 30.0) -> str:
         """Send task to agent. Returns task_id."""
@@ -190,6 +208,7 @@ class SimpleAgentManager:
         if not agent.authenticated:
             raise ValueError(f"Agent not authenticated: {agent_id}")
         
+        self._purge_expired_tasks()
         task_id = str(uuid.uuid4())
         
         task = PendingTask(
@@ -239,6 +258,38 @@ class SimpleAgentManager:
                 del self._task_queues[task_id]
             if task_id in self.pending_tasks:
                 del self.pending_tasks[task_id]
+    
+    def poll_task(self, task_id: str, timeout: float = 0.0) -> Optional[dict]:
+        """Return task result if finished, waiting up to timeout seconds.
+        
+        Unlike wait_for_task, the task stays pending when no result arrived yet,
+        so clients can poll again. The result is handed out once.
+        """
+        queue = self._task_queues.get(task_id)
+        if queue is None:
+            return None
+        
+        try:
+            result = queue.get(timeout=timeout) if timeout > 0 else queue.get_nowait()
+        except Empty:
+            return None
+        
+        self._task_queues.pop(task_id, None)
+        self.pending_tasks.pop(task_id, None)
+        return result
+    
+    def _purge_expired_tasks(self):
+        """Drop tasks nobody collected within their timeout plus TASK_RESULT_TTL."""
+        now = time.time()
+        expired = [
+            task_id for task_id, task in list(self.pending_tasks.items())
+            if now - task.created_at > task.timeout + TASK_RESULT_TTL
+        ]
+        for task_id in expired:
+            self.pending_tasks.pop(task_id, None)
+            self._task_queues.pop(task_id, None)
+        if expired:
+            self.logger.info(f"Purged {len(expired)} expired tasks")
 
 
 # Global instance
@@ -7,22 +7,13 @@ import logging
 from flask import jsonify, request, current_app
 from . import api_bp
 from app.core.cmts_provider import CMTSProvider
+from app.core.pnm_common import channel_stats_executor, get_cmts_community, get_default_community
 from app.core.simple_ws import get_simple_agent_manager
 
 # Default TFTP server (same as pypnm_routes.py)
 DEFAULT_TFTP_IP = os.environ.get('TFTP_IPV4', '172.22.147.18')
 
 
-def get_default_community():
-    """Get default SNMP community for modems based on mode."""
-    return 'z1gg0m0n1t0r1ng' if os.environ.get('PYPNM_MODE') == 'lab' else 'm0d3m1nf0'
-
-
-def get_cmts_community():
-    """Get default SNMP community for CMTS operations."""
-    return 'Z1gg0Sp3c1@l' if os.environ.get('PYPNM_MODE') == 'lab' else 'private'
-
-
 # Redis for caching modem data
 try:
     import redis
@@ -629,7 +620,7 @@ def get_cmts_modems(hostname):
     """
     from app.core.simple_ws import get_simple_agent_manager
     
-    community = request.args.get('community', get_cmts_community())
+    community = request.args['community'] if 'community' in request.args else get_cmts_community()
     limit = int(request.args.get('limit', 500))
     
     # Get CMTS IP from our CMTS provider
@@ -737,7 +728,7 @@ def get_cmts_modems(hostname):
             "status": "success",
             "cmts_hostname": hostname,
             "cmts_ip": cmts_ip,
-            "cmts_community": cmts.get('snmp_rw_community', get_cmts_community()),
+            "cmts_community": cmts['snmp_rw_community'] if 'snmp_rw_community' in cmts else get_cmts_community(),
             "tftp_ip": cmts.get('tftp_ip', DEFAULT_TFTP_IP),  # Use default TFTP server, not CMTS IP
             "cmts_vendor": cmts.get('Vendor'),
             "cmts_type": cmts.get('Type'),
@@ -1272,9 +1263,9 @@ def get_ofdm_rxmer_data(mac_address):
 @api_bp.route('/pypnm/health', methods=['GET'])
 def pypnm_health():
     """Check PyPNM API health."""
-    from app.core.pypnm_client import PyPNMClient
+    from app.core.pypnm_client import get_pypnm_client
     
-    client = PyPNMClient()
+    client = get_pypnm_client()
     try:
         import requests
         response = requests.get(f"{client.config.base_url}/health", timeout=5)
@@ -1302,13 +1293,13 @@ def pypnm_health():
 @api_bp.route('/pypnm/modem/<mac_address>/rxmer', methods=['POST'])
 def pypnm_rxmer(mac_address):
     """Get RxMER capture via PyPNM."""
-    from app.core.pypnm_client import PyPNMClient
+    from app.core.pypnm_client import get_pypnm_client
     import os
     
     data = request.get_json() or {}
     modem_ip = data.get('modem_ip')
     # Use LAB community in LAB mode, otherwise default
-    default_community = get_default_community() if os.environ.get('PYPNM_MODE') == 'lab' else get_default_community()
+    default_community = get_default_community()
     community = data.get('community', default_community)
     # Default TFTP IP for lab environment - 172.22.147.18 is the working TFTP server
     tftp_ip = data.get('tftp_ip', os.environ.get('TFTP_IPV4', '172.22.147.18'))
@@ -1319,7 +1310,7 @@ def pypnm_rxmer(mac_address):
     if not tftp_ip:
         return jsonify({"status": "error", "message": "TFTP server not configured. Set TFTP_IPV4 environment variable."}), 400
     
-    client = PyPNMClient()
+    client = get_pypnm_client()
     result = client.get_rxmer_capture(mac_address, modem_ip, tftp_ip, community)
     
     # PyPNM returns status: 0 for success
@@ -1331,7 +1322,7 @@ def pypnm_rxmer(mac_address):
 @api_bp.route('/pypnm/modem/<mac_address>/spectrum', methods=['POST'])
 def pypnm_spectrum(mac_address):
     """Get spectrum analyzer capture via PyPNM."""
-    from app.core.pypnm_client import PyPNMClient
+    from app.core.pypnm_client import get_pypnm_client
     
     data = request.get_json() or {}
     modem_ip = data.get('modem_ip')
@@ -1341,7 +1332,7 @@ def pypnm_spectrum(mac_address):
     if not modem_ip:
         return jsonify({"status": "error", "message": "modem_ip required"}), 400
     
-    client = PyPNMClient()
+    client = get_pypnm_client()
     result = client.get_spectrum_capture(mac_address, modem_ip, tftp_ip, community)
     
     if result.get('status') == 'error':
@@ -1352,7 +1343,7 @@ def pypnm_spectrum(mac_address):
 @api_bp.route('/pypnm/modem/<mac_address>/fec', methods=['POST'])
 def pypnm_fec(mac_address):
     """Get FEC summary via PyPNM."""
-    from app.core.pypnm_client import PyPNMClient
+    from app.core.pypnm_client import get_pypnm_client
     
     data = request.get_json() or {}
     modem_ip = data.get('modem_ip')
@@ -1362,7 +1353,7 @@ def pypnm_fec(mac_address):
     if not modem_ip:
         return jsonify({"status": "error", "message": "modem_ip required"}), 400
     
-    client = PyPNMClient()
+    client = get_pypnm_client()
     result = client.get_fec_summary(mac_address, modem_ip, tftp_ip, community)
     
     if result.get('status') == 'error':
@@ -1373,13 +1364,13 @@ def pypnm_fec(mac_address):
 @api_bp.route('/pypnm/modem/<mac_address>/constellation', methods=['POST'])
 def pypnm_constellation(mac_address):
     """Get constellation display via PyPNM."""
-    from app.core.pypnm_client import PyPNMClient
+    from app.core.pypnm_client import get_pypnm_client
     import os
     
     data = request.get_json() or {}
     modem_ip = data.get('modem_ip')
     # Use LAB community in LAB mode, otherwise default
-    default_community = get_default_community() if os.environ.get('PYPNM_MODE') == 'lab' else get_default_community()
+    default_community = get_default_community()
     community = data.get('community', default_community)
     # Default TFTP IP for lab environment - 172.22.147.18 is the working TFTP server
     tftp_ip = data.get('tftp_ip', os.environ.get('TFTP_IPV4', '172.22.147.18'))
@@ -1390,7 +1381,7 @@ def pypnm_constellation(mac_address):
     if not tftp_ip:
         return jsonify({"status": "error", "message": "TFTP server not configured. Set TFTP_IPV4 environment variable."}), 400
     
-    client = PyPNMClient()
+    client = get_pypnm_client()
     result = client.get_constellation_display(mac_address, modem_ip, tftp_ip, community)
     
     if result.get('status') == 'error':
@@ -1401,7 +1392,7 @@ def pypnm_constellation(mac_address):
 @api_bp.route('/pypnm/modem/<mac_address>/channel-stats', methods=['POST'])
 def pypnm_channel_stats(mac_address):
     """Get DOCSIS channel statistics via PyPNM."""
-    from app.core.pypnm_client import PyPNMClient
+    from app.core.pypnm_client import get_pypnm_client
     
     data = request.get_json() or {}
     modem_ip = data.get('modem_ip')
@@ -1410,13 +1401,15 @@ def pypnm_channel_stats(mac_address):
     if not modem_ip:
         return jsonify({"status": "error", "message": "modem_ip required"}), 400
     
-    client = PyPNMClient()
+    client = get_pypnm_client()
     
-    # Get all channel stats
-    ds_scqam = client.get_ds_scqam_stats(mac_address, modem_ip, community)
-    ds_ofdm = client.get_ds_ofdm_stats(mac_address, modem_ip, community)
-    us_atdma = client.get_us_atdma_stats(mac_address, modem_ip, community)
-    us_ofdma = client.get_us_ofdma_stats(mac_address, modem_ip, community)
+    # Get all channel stats; the four SNMP walks run in parallel
+    futures = [
+        channel_stats_executor.submit(fetch, mac_address, modem_ip, community)
+        for fetch in (client.get_ds_scqam_stats, client.get_ds_ofdm_stats,
+                      client.get_us_atdma_stats, client.get_us_ofdma_stats)
+    ]
+    ds_scqam, ds_ofdm, us_atdma, us_ofdma = (future.result() for future in futures)
     
     return jsonify({
         "mac_address": mac_address,
@@ -1434,7 +1427,7 @@ def pypnm_channel_stats(mac_address):
 @api_bp.route('/pypnm/modem/<mac_address>/pre-eq', methods=['POST'])
 def pypnm_pre_eq(mac_address):
     """Get pre-equalization data via PyPNM (ATDMA only, no TFTP needed)."""
-    from app.core.pypnm_client import PyPNMClient
+    from app.core.pypnm_client import get_pypnm_client
     
     data = request.get_json() or {}
     modem_ip = data.get('modem_ip')
@@ -1443,7 +1436,7 @@ def pypnm_pre_eq(mac_address):
     if not modem_ip:
         return jsonify({"status": "error", "message": "modem_ip required"}), 400
     
-    client = PyPNMClient()
+    client = get_pypnm_client()
     result = client.get_us_pre_equalization(mac_address, modem_ip, community)
     
     if result.get('status') == 'error':
@@ -1454,7 +1447,7 @@ def pypnm_pre_eq(mac_address):
 @api_bp.route('/pypnm/modem/<mac_address>/sysdescr', methods=['POST'])
 def pypnm_sysdescr(mac_address):
     """Get system description via PyPNM."""
-    from app.core.pypnm_client import PyPNMClient
+    from app.core.pypnm_client import get_pypnm_client
     import re
     
     data = request.get_json() or {}
@@ -1464,7 +1457,7 @@ def pypnm_sysdescr(mac_address):
     if not modem_ip:
         return jsonify({"status": "error", "message": "modem_ip required"}), 400
     
-    client = PyPNMClient()
+    client = get_pypnm_client()
     result = client.get_sys_descr(mac_address, modem_ip, community)
     
     # PyPNM returns status: 0 for success
@@ -1518,7 +1511,7 @@ def pypnm_sysdescr(mac_address):
 @api_bp.route('/pypnm/modem/<mac_address>/event-log', methods=['POST'])
 def pypnm_event_log(mac_address):
     """Get event log via PyPNM."""
-    from app.core.pypnm_client import PyPNMClient
+    from app.core.pypnm_client import get_pypnm_client
     
     data = request.get_json() or {}
     modem_ip = data.get('modem_ip')
@@ -1527,7 +1520,7 @@ def pypnm_event_log(mac_address):
     if not modem_ip:
         return jsonify({"status": "error", "message": "modem_ip required"}), 400
     
-    client = PyPNMClient()
+    client = get_pypnm_client()
     result = client.get_event_log(mac_address, modem_ip, community)
     
     # PyPNM returns status: 0 for success
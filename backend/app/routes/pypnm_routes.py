@@ -3,14 +3,34 @@
 #
 # Complete PyPNM API integration with plot support
 
-from flask import Blueprint, request, jsonify, send_file
-from typing import Dict, Any
+from flask import Blueprint, Response, current_app, request, jsonify, send_from_directory, url_for
+from dataclasses import dataclass
+from werkzeug.exceptions import NotFound
+from typing import Dict, Any, List, Optional
+import functools
+import gzip
+import heapq
 import logging
+import multiprocessing
 import os
+import shutil
+import tarfile
 import tempfile
+import threading
+import time
+import uuid
 import zipfile
-from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from fnmatch import fnmatch
+from operator import itemgetter
 import json
+import numpy as np
+import requests
+
+from app.core.fast_stat import stat_mtime_size
+from app.core.pnm_common import channel_stats_executor, get_cmts_community, get_default_community, get_default_write_community
+from app.core.pypnm_client import ArchiveDownload, get_pypnm_client
 
 # Import spectrum plotter for generating matplotlib plots
 from app.core.spectrum_plotter import generate_spectrum_plot_from_data
@@ -20,39 +40,541 @@ logger = logging.getLogger(__name__)
 
 pypnm_bp = Blueprint('pypnm', __name__, url_prefix='/api/pypnm')
 
-# Redis client for caching
+# Shared volumes: PyPNM writes matplotlib plots to PLOT_DIR, archives land in DATA_DIR
+PLOT_DIR = "/pypnm-data/png"
+DATA_DIR = "/app/data"
+ARCHIVE_PLOT_DIR = f"{DATA_DIR}/plots"  # PNGs extracted from archives, served by URL
+_DATA_DIR_REAL = os.path.realpath(DATA_DIR)
+
+# Redis client for caching. redis-py connects lazily, so no ping() round
+# trip at import; an unreachable server surfaces (and is logged) at first use.
 try:
     import redis
     REDIS_HOST = os.environ.get('REDIS_HOST', 'localhost')
     REDIS_PORT = int(os.environ.get('REDIS_PORT', 6379))
-    redis_client = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=True)
-    redis_client.ping()
+    redis_client = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=True,
+                               socket_connect_timeout=2, socket_timeout=2)
     REDIS_AVAILABLE = True
 except:
     redis_client = None
     REDIS_AVAILABLE = False
 
+# Cache writes that are not on a response's critical path
+_redis_write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='redis-write')
+
+
+def _redis_call(method: str, *args):
+    """
+    Run a Redis command, returning None when Redis is unavailable.
+    
+    The first connection failure disables Redis for this process (as the
+    old import-time ping did) so later requests don't wait on timeouts.
+    """
+    global REDIS_AVAILABLE
+    if not REDIS_AVAILABLE:
+        return None
+    try:
+        return getattr(redis_client, method)(*args)
+    except redis.ConnectionError as e:
+        REDIS_AVAILABLE = False
+        logger.warning(f"Redis not reachable, caching disabled: {e}")
+        return None
+
 
-def get_default_community():
-    """Get default SNMP community for modems based on mode."""
-    return 'z1gg0m0n1t0r1ng' if os.environ.get('PYPNM_MODE') == 'lab' else 'm0d3m1nf0'
+def _cache_utsc_config(mac_address: str, config: Dict[str, Any]) -> None:
+    """Store a UTSC capture config for later plot generation (1 hour TTL)."""
+    try:
+        _redis_call('setex', f'utsc_config:{mac_address}', 3600, json.dumps(config))
+    except Exception as e:
+        logger.warning(f"Failed to cache UTSC config: {e}")
+
+# pybase64's SIMD codec is a drop-in for the stdlib base64 functions used here
+try:
+    from pybase64 import b64encode, b64encode_as_string
+except ImportError:
+    from base64 import b64encode
+    
+    def b64encode_as_string(s) -> str:
+        return b64encode(s).decode('ascii')
 
+JSON_GZIP_MIN_SIZE = 2048  # Smaller bodies are not worth compressing
 
-def get_default_write_community():
-    """Get default SNMP write community for modem PNM operations (SET)."""
-    return 'z1gg0m0n1t0r1ng' if os.environ.get('PYPNM_MODE') == 'lab' else 'private'
+# Optional inotify bindings: wake on plot writes instead of polling the plot dir
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+# Optional io_uring bindings for batched unlinks during housekeeping
+try:
+    import liburing
+    LIBURING_AVAILABLE = True
+except ImportError:
+    LIBURING_AVAILABLE = False
+
+
+@pypnm_bp.after_request
+def _gzip_json(response: Response) -> Response:
+    """
+    Gzip (fast level 1) JSON bodies of JSON_GZIP_MIN_SIZE bytes or more when
+    the client accepts it; spectrum arrays typically shrink 5-10x.
+    Streamed responses are left as they are.
+    """
+    if (response.mimetype != 'application/json' or response.is_streamed
+            or 'Content-Encoding' in response.headers):
+        return response
+    response.vary.add('Accept-Encoding')
+    if 'gzip' in request.accept_encodings:
+        body = response.get_data()
+        if len(body) >= JSON_GZIP_MIN_SIZE:
+            response.set_data(gzip.compress(body, compresslevel=1))
+            response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+
+_MAC_SEPARATORS = str.maketrans('', '', ':-.')
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+
+@functools.lru_cache(maxsize=4096)
+def _norm_mac(mac: str) -> str:
+    """
+    MAC address as bare lower-case hex, as used in PyPNM/TFTP filenames
+    (cached for polled modems). Accepts every notation _is_mac accepts.
+    """
+    return mac.translate(_MAC_SEPARATORS).lower()
 
 
-def get_cmts_community():
-    """Get default SNMP community for CMTS operations."""
-    return 'Z1gg0Sp3c1@l' if os.environ.get('PYPNM_MODE') == 'lab' else 'private'
+@functools.lru_cache(maxsize=4096)
+def _is_mac(mac: str) -> bool:
+    """True for a 48-bit MAC address in colon, dash, dot or bare hex notation."""
+    digits = mac.translate(_MAC_SEPARATORS)
+    return len(digits) == 12 and _HEX_DIGITS.issuperset(digits)
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_tftp():
-    """Get default TFTP IP."""
+    """Get default TFTP IP (read from the environment once)."""
     return os.environ.get('TFTP_IPV4', '172.22.147.18')
 
 
+@dataclass
+class UpstreamRequest:
+    """Common CMTS/upstream POST body fields, parsed and validated once per request."""
+    cmts_ip: Optional[str] = None
+    community: Optional[str] = None
+    rf_port_ifindex: Optional[int] = None
+    ofdma_ifindex: Optional[int] = None
+    
+    @classmethod
+    def parse(cls, data: Dict[str, Any], *required: str) -> 'UpstreamRequest':
+        """Build from a JSON body; raises ValueError naming missing or malformed fields."""
+        missing = [name for name in required if not data.get(name)]
+        if missing:
+            raise ValueError(f"{' and '.join(missing)} required")
+        
+        ifindexes = {}
+        for name in ('rf_port_ifindex', 'ofdma_ifindex'):
+            value = data.get(name)
+            try:
+                ifindexes[name] = int(value) if value not in (None, '') else None
+            except (TypeError, ValueError):
+                raise ValueError(f"{name} must be an integer")
+        
+        return cls(
+            cmts_ip=data.get('cmts_ip'),
+            community=data['community'] if 'community' in data else get_cmts_community(),
+            **ifindexes
+        )
+
+
+# Base64-encoded plot payloads keyed by (path, st_mtime_ns); rewriting a plot
+# changes its mtime, so stale entries are never served. Polling clients get
+# the cached string back with a dict lookup instead of a read + encode.
+# Bounded by total encoded size, since a single plot can be several MB.
+_plot_blob_cache: Dict[tuple, Dict[str, str]] = {}
+_plot_blob_lock = threading.Lock()
+_plot_blob_cache_bytes = 0
+PLOT_BLOB_CACHE_BYTES = 32 * 1024 * 1024
+
+
+def _plot_entry(filepath: str, mtime_ns: int = None) -> Dict[str, str]:
+    """Return {'filename', 'data'} for a PNG, reusing the cached base64 encoding."""
+    global _plot_blob_cache_bytes
+    if mtime_ns is None:
+        mtime_ns = os.stat(filepath).st_mtime_ns
+    key = (filepath, mtime_ns)
+    entry = _plot_blob_cache.get(key)
+    if entry is None:
+        # One readinto() of the whole PNG into a pre-sized buffer, no BufferedReader
+        with open(filepath, 'rb', buffering=0) as f:
+            st = os.fstat(f.fileno())
+            buf = bytearray(st.st_size)
+            n = f.readinto(buf)
+        # Key on the mtime of what was actually read, in case the file changed since it was listed
+        key = (filepath, st.st_mtime_ns)
+        entry = {
+            'filename': os.path.basename(filepath),
+            'data': b64encode_as_string(memoryview(buf)[:n])
+        }
+        size = len(entry['data'])
+        with _plot_blob_lock:
+            if key not in _plot_blob_cache and size <= PLOT_BLOB_CACHE_BYTES:
+                while _plot_blob_cache_bytes + size > PLOT_BLOB_CACHE_BYTES:
+                    # Evict the oldest insertion
+                    evicted = _plot_blob_cache.pop(next(iter(_plot_blob_cache)))
+                    _plot_blob_cache_bytes -= len(evicted['data'])
+                _plot_blob_cache[key] = entry
+                _plot_blob_cache_bytes += size
+    return dict(entry)
+
+
+def _plot_ref(filepath: str, mtime_ns: int, inline: bool) -> Dict[str, str]:
+    """Plot in PLOT_DIR as {'filename', 'data'} (inline) or {'filename', 'url'}."""
+    if inline:
+        return _plot_entry(filepath, mtime_ns)
+    filename = os.path.basename(filepath)
+    return {
+        'filename': filename,
+        'url': url_for('pypnm.plot_file', name=filename)
+    }
+
+
+# Reads uncached plot PNGs concurrently so their disk I/O overlaps
+_plot_read_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='plot-read')
+
+
+def _warm_plot_entry(item: tuple) -> None:
+    """Load one (path, st_mtime_ns) plot into the payload cache; errors surface in _plot_refs."""
+    try:
+        _plot_entry(*item)
+    except OSError:
+        pass
+
+
+def _plot_refs(plot_files: list, inline: bool, timestamps: bool = False) -> list:
+    """Build _plot_ref entries for [(path, st_mtime_ns)], skipping unreadable plots."""
+    if inline:
+        misses = [item for item in plot_files if item not in _plot_blob_cache]
+        if len(misses) > 1:
+            list(_plot_read_executor.map(_warm_plot_entry, misses))
+    
+    plots = []
+    for filepath, mtime_ns in plot_files:
+        try:
+            plot = _plot_ref(filepath, mtime_ns, inline)
+        except Exception as e:
+            logger.error(f"Failed to read plot {filepath}: {e}")
+            continue
+        if timestamps:
+            plot['timestamp'] = mtime_ns / 1e9
+        plots.append(plot)
+    return plots
+
+
+def _stream_inline_plots(plot_files: list, dumps):
+    """Yield the get_plots JSON body with inline plots, encoding one plot at a time."""
+    # Reads are queued up front so disk I/O overlaps; plots are still emitted in order
+    futures = [_plot_read_executor.submit(_plot_entry, filepath, mtime_ns)
+               for filepath, mtime_ns in plot_files]
+    yield '{"status":"success","plots":['
+    count = 0
+    for (filepath, mtime_ns), future in zip(plot_files, futures):
+        try:
+            plot = future.result()
+        except Exception as e:
+            logger.error(f"Failed to read plot {filepath}: {e}")
+            continue
+        plot['timestamp'] = mtime_ns / 1e9
+        yield (',' if count else '') + dumps(plot)
+        count += 1
+    yield f'],"count":{count}}}'
+
+
+PLOT_WAIT_TIMEOUT = 1.0  # Upper bound for plots to appear (the old fixed sleep)
+PLOT_SETTLE_TIME = 0.1  # Quiet period after the last plot write
+
+
+def _open_plot_watch():
+    """
+    inotify watch on PLOT_DIR for finished plot writes, or None without inotify.
+    
+    Open it before starting a capture so writes during the PyPNM call are queued.
+    """
+    if not INOTIFY_AVAILABLE:
+        return None
+    watch = None
+    try:
+        watch = INotify()
+        watch.add_watch(PLOT_DIR, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+    except OSError as e:
+        logger.debug(f"inotify unavailable for {PLOT_DIR}: {e}")
+        if watch is not None:
+            watch.close()
+        return None
+    return watch
+
+
+def _wait_for_plots(mac_clean: str, since_ns: int, watch=None) -> None:
+    """
+    Wait for PyPNM to finish writing this modem's plots to PLOT_DIR.
+    
+    since_ns is the capture start. Returns once at least one plot newer than
+    that exists, every such plot is complete and none changed for
+    PLOT_SETTLE_TIME, or after PLOT_WAIT_TIMEOUT. With watch (from
+    _open_plot_watch) a plot is complete once its CLOSE_WRITE/MOVED_TO event
+    was read; otherwise once its size and mtime stop changing between polls.
+    """
+    deadline = time.monotonic() + PLOT_WAIT_TIMEOUT
+    finished = set()  # Plot names whose write was closed (inotify)
+    last_seen = None  # {path: (size, mtime_ns)} at the previous poll
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        wait = min(PLOT_SETTLE_TIME, remaining)
+        # The plots _recent_plots will return
+        candidates = [path for path, _ in _newest_plot_files(PLOT_DIR, mac_clean, 10, since_ns=since_ns)]
+        
+        if watch is not None:
+            written = {
+                event.name for event in watch.read(timeout=int(wait * 1000))
+                if event.name.startswith(mac_clean) and event.name.endswith('.png')
+            }
+            finished |= written
+            if (candidates and not written
+                    and all(os.path.basename(path) in finished for path in candidates)):
+                return
+        else:
+            # A file written in place doesn't touch the directory mtime; compare the files
+            seen = {}
+            for path in candidates:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue  # Removed since the listing
+                seen[path] = (st.st_size, st.st_mtime_ns)
+            if seen and seen == last_seen:
+                return
+            last_seen = seen
+            time.sleep(wait)
+
+
+B64_CHUNK = 3 * 64 * 1024  # Multiple of 3 so per-chunk encodings concatenate cleanly
+
+
+# Archive magic bytes -> format (file extension) of PyPNM archive downloads
+ARCHIVE_FORMATS = (
+    (b'PK', 'zip'),
+    (b'\x1f\x8b', 'tar.gz'),
+)
+
+
+def _archive_format(head: bytes) -> str:
+    """Archive format from the first bytes of a download; unrecognised data is treated as tar.gz."""
+    for magic, archive_ext in ARCHIVE_FORMATS:
+        if head.startswith(magic):
+            return archive_ext
+    return 'tar.gz'
+
+
+def _iter_archive_files(path: str, archive_ext: str):
+    """
+    Yield (member name, open file object) for each regular file in a ZIP or
+    tar.gz archive, in archive order. Each file object is only valid until
+    the next item is requested; tar.gz is read as one sequential gzip
+    stream ('r|gz') instead of seeking back to members by name.
+    """
+    if archive_ext == 'zip':
+        with zipfile.ZipFile(path, 'r') as zf:
+            for info in zf.infolist():
+                if not info.is_dir():
+                    with zf.open(info) as src:
+                        yield info.filename, src
+    else:
+        with tarfile.open(path, mode='r|gz') as tf:
+            for member in tf:
+                if member.isfile():
+                    with tf.extractfile(member) as src:
+                        yield member.name, src
+
+
+def _attach_archive_plot(plot: Dict[str, str], src, plot_subdir: str, inline: bool) -> None:
+    """Add an archive member PNG to plot as base64 'data' (inline) or as a 'url' to a copy under ARCHIVE_PLOT_DIR."""
+    if inline:
+        plot['data'] = _b64encode_stream(src)
+        return
+    name = f"{plot_subdir}/{plot['filename']}"
+    path = os.path.join(ARCHIVE_PLOT_DIR, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as out:
+        shutil.copyfileobj(src, out, B64_CHUNK)
+    plot['url'] = url_for('pypnm.archive_plot_file', name=name)
+
+
+def _b64encode_stream(src) -> str:
+    """Base64-encode a file object in chunks instead of reading it whole first."""
+    parts = []
+    tail = b''
+    while True:
+        chunk = src.read(B64_CHUNK)
+        if not chunk:
+            break
+        if tail:
+            chunk = tail + chunk
+        cut = len(chunk) - len(chunk) % 3
+        parts.append(b64encode(chunk[:cut]))
+        tail = chunk[cut:]
+    parts.append(b64encode(tail))
+    return b''.join(parts).decode('ascii')
+
+
+def _ttl_cache_get(cache: Dict[tuple, tuple], key: tuple):
+    """Return the payload cached under key if it hasn't expired, else None."""
+    cached = cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def _ttl_cache_put(cache: Dict[tuple, tuple], lock: threading.Lock, key: tuple,
+                   payload: Any, ttl: float, max_size: int) -> None:
+    """Cache payload under key for ttl seconds, dropping expired then oldest entries when full."""
+    with lock:
+        if len(cache) >= max_size:
+            now = time.monotonic()
+            for old_key in [k for k, (expires, _) in cache.items() if expires <= now]:
+                del cache[old_key]
+            if len(cache) >= max_size:
+                # Still full: evict the oldest insertion
+                cache.pop(next(iter(cache)))
+        cache[key] = (time.monotonic() + ttl, payload)
+
+
+# Recent successful JSON measurement payloads keyed by request parameters ->
+# (expires_at, payload), so dashboards re-requesting the same capture within
+# the TTL don't trigger another multi-second PNM capture on the modem
+_measurement_cache: Dict[tuple, tuple] = {}
+_measurement_cache_lock = threading.Lock()
+MEASUREMENT_CACHE_TTL = 30  # Seconds
+MEASUREMENT_CACHE_SIZE = 16  # Spectrum results still carry a base64 plot
+
+
+# Matplotlib rendering is CPU-bound; worker processes keep it from holding the
+# GIL and stalling every other request served by this (eventlet) worker
+PLOT_WORKERS = min(4, os.cpu_count() or 1)
+PLOT_RENDER_TIMEOUT = 60  # Seconds per plot
+_plot_pool: Optional[ProcessPoolExecutor] = None
+_plot_pool_lock = threading.Lock()
+
+
+def _get_plot_pool() -> ProcessPoolExecutor:
+    """Create the plot rendering process pool on first use (spawned, not forked from this threaded process)."""
+    global _plot_pool
+    if _plot_pool is None:
+        with _plot_pool_lock:
+            if _plot_pool is None:
+                _plot_pool = ProcessPoolExecutor(max_workers=PLOT_WORKERS,
+                                                 mp_context=multiprocessing.get_context('spawn'))
+    return _plot_pool
+
+
+def _plot_worker_ready() -> None:
+    """No-op job; unpickling it imports this module (and matplotlib) in the worker."""
+
+
+def _warm_plot_pool() -> None:
+    """Spawn the plot workers while a capture is still running, so rendering doesn't wait on startup."""
+    if _plot_pool is None:
+        pool = _get_plot_pool()
+        for _ in range(PLOT_WORKERS):
+            pool.submit(_plot_worker_ready)
+
+
+def _render_plots(func, *jobs: tuple, failed=None) -> list:
+    """
+    Run func(*args) for each args tuple in jobs on the plot process pool and
+    return the results in order; a job that times out yields failed. Renders
+    in-process if the pool is broken.
+    """
+    global _plot_pool
+    pool = _get_plot_pool()
+    try:
+        futures = [pool.submit(func, *args) for args in jobs]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result(timeout=PLOT_RENDER_TIMEOUT))
+            except FutureTimeoutError:
+                logger.error(f"Plot render {func.__name__} timed out after {PLOT_RENDER_TIMEOUT}s")
+                results.append(failed)
+        return results
+    except BrokenProcessPool as e:
+        logger.warning(f"Plot process pool broken, rendering in-process: {e}")
+        with _plot_pool_lock:
+            if _plot_pool is pool:
+                _plot_pool = None
+        # Reap the remaining workers; the next render starts a fresh pool
+        pool.shutdown(wait=False, cancel_futures=True)
+        return [func(*args) for args in jobs]
+
+
+def _recent_plots(mac_clean: str, since_ns: int, inline: bool,
+                  wait: bool = False, watch=None) -> list:
+    """
+    Up to 10 newest PLOT_DIR plots for a modem written after since_ns, as
+    _plot_ref entries. With wait, first let PyPNM finish writing them
+    (see _wait_for_plots; since_ns should then be the capture start).
+    """
+    if not os.path.exists(PLOT_DIR):
+        return []
+    if wait:
+        _wait_for_plots(mac_clean, since_ns, watch)
+    plot_files = _newest_plot_files(PLOT_DIR, mac_clean, 10, since_ns=since_ns)
+    logger.info(f"Found {len(plot_files)} plots for {mac_clean} since {since_ns / 1e9:.3f}")
+    return _plot_refs(plot_files, inline)
+
+
+def _append_spectrum_plot(plots: list, result: Dict[str, Any], mac_address: str) -> None:
+    """Render the spectrum analyzer plot from PyPNM's JSON data and append it to plots."""
+    spectrum_data = result.get('data', {})
+    if not spectrum_data:
+        return
+    logger.info(f"Generating spectrum plot for {mac_address}")
+    try:
+        spectrum_plot = _render_plots(generate_spectrum_plot_from_data, (spectrum_data, mac_address))[0]
+        if spectrum_plot:
+            plots.append(spectrum_plot)
+            logger.info(f"Successfully generated spectrum plot: {spectrum_plot['filename']}")
+    except Exception as e:
+        logger.error(f"Failed to generate spectrum plot: {e}", exc_info=True)
+
+
+def _render_constellation_plots(raw_data: list, mac_address: str) -> list:
+    """Constellation plots for PyPNM constellation data, one channel per pool job."""
+    return [
+        plot
+        for channel_plots in _render_plots(generate_constellation_plots_from_data,
+                                           *[([item], mac_address) for item in raw_data], failed=[])
+        for plot in channel_plots
+    ]
+
+
+# Modem-based measurement types -> (PyPNMClient method, builder for type-specific kwargs from the POST body).
+# All of them take (mac, modem_ip, tftp_ip, community, tftp_ipv6, output_type); us_spectrum is CMTS-based.
+MODEM_MEASUREMENTS = {
+    'rxmer': ('get_rxmer_capture', lambda d: {}),
+    'spectrum': ('get_spectrum_capture', lambda d: {}),
+    'channel_estimation': ('get_channel_estimation', lambda d: {}),
+    'modulation_profile': ('get_modulation_profile', lambda d: {}),
+    'fec_summary': ('get_fec_summary', lambda d: {'fec_summary_type': d.get('fec_summary_type', 2)}),
+    'histogram': ('get_histogram', lambda d: {'sample_duration': d.get('sample_duration', 60)}),
+    'constellation': ('get_constellation_display', lambda d: {}),
+    'us_pre_eq': ('get_us_ofdma_pre_equalization', lambda d: {}),
+}
+
+
 @pypnm_bp.route('/measurements/<measurement_type>/<mac_address>', methods=['POST'])
 def pnm_measurement(measurement_type, mac_address):
     """
@@ -77,15 +599,26 @@ def pnm_measurement(measurement_type, mac_address):
         "fec_summary_type": 2,  # Only for FEC (2=10min, 3=24hr)
         "sample_duration": 60    # Only for histogram
     }
+    
+    Query: ?nocache=1 skips the short-lived result cache for JSON captures
+    (cached results carry "cached": true).
+    Plots PyPNM wrote to PLOT_DIR are returned as URLs to /plot_file and
+    archive plots are extracted to ARCHIVE_PLOT_DIR and returned as URLs to
+    /archive_plot (browser-cacheable); ?inline=1 returns base64 plot data instead.
     """
-    from app.core.pypnm_client import PyPNMClient
+    # Reject malformed MACs before starting a multi-second capture
+    if not _is_mac(mac_address):
+        return jsonify({"status": "error", "message": "Invalid mac_address"}), 400
     
     data = request.get_json() or {}
     modem_ip = data.get('modem_ip')
+    mac_clean = _norm_mac(mac_address)
     # Use write community for PNM operations that require SET
     community = data.get('community', get_default_write_community())
-    tftp_ip = data.get('tftp_ip', get_default_tftp())
+    tftp_ip = data['tftp_ip'] if 'tftp_ip' in data else get_default_tftp()
     output_type = data.get('output_type', 'json')
+    # Plot URLs by default, like get_plots; ?inline=1 for base64 data
+    inline_plots = request.args.get('inline') == '1'
     
     # Spectrum analyzer: always use JSON mode from PyPNM, then generate plots ourselves
     if measurement_type == 'spectrum':
@@ -101,21 +634,31 @@ def pnm_measurement(measurement_type, mac_address):
     if not modem_ip and measurement_type != 'us_spectrum':
         return jsonify({"status": "error", "message": "modem_ip required"}), 400
     
-    client = PyPNMClient()
+    # JSON captures of modem measurements are cached; ?nocache=1 forces a new capture.
+    # Results with inline base64 plots are too large to keep around.
+    cache_key = None
+    if measurement_type in MODEM_MEASUREMENTS and not requested_archive and not inline_plots:
+        cache_key = (measurement_type, mac_address, modem_ip, community, tftp_ip,
+                     data.get('fec_summary_type'), data.get('sample_duration'))
+        if request.args.get('nocache') != '1':
+            cached = _ttl_cache_get(_measurement_cache, cache_key)
+            if cached is not None:
+                # Flag it so callers can tell a repeated result from a new capture
+                return jsonify({**cached, "cached": True})
+    
+    if measurement_type in ('spectrum', 'constellation'):
+        _warm_plot_pool()
+    
+    client = get_pypnm_client()
+    
+    # Plots of this capture are the ones written from now on; when they will be
+    # waited for, watch PLOT_DIR before the call so no write is missed
+    plot_watch = _open_plot_watch() if requested_archive else None
+    capture_start_ns = time.time_ns()
     
     # Route to appropriate method
     try:
-        if measurement_type == 'rxmer':
-            result = client.get_rxmer_capture(
-                mac_address, modem_ip, tftp_ip, community, 
-                tftp_ipv6="::1", output_type=output_type
-            )
-        elif measurement_type == 'spectrum':
-            result = client.get_spectrum_capture(
-                mac_address, modem_ip, tftp_ip, community,
-                tftp_ipv6="::1", output_type=output_type
-            )
-        elif measurement_type == 'us_spectrum':
+        if measurement_type == 'us_spectrum':
             # UTSC is CMTS-based, not modem-based - requires different parameters
             cmts_ip = data.get('cmts_ip')
             rf_port_ifindex = data.get('rf_port_ifindex')
@@ -123,7 +666,7 @@ def pnm_measurement(measurement_type, mac_address):
             center_freq_hz = data.get('center_freq_hz', 30000000)  # 30 MHz
             span_hz = data.get('span_hz', 80000000)  # 80 MHz
             num_bins = data.get('num_bins', 800)
-            filename = data.get('filename', f'utsc_{mac_address.replace(":", "")}')
+            filename = data.get('filename', f'utsc_{mac_clean}')
             cm_mac = data.get('cm_mac') if trigger_mode == 6 else None
             logical_ch_ifindex = data.get('logical_ch_ifindex')
             
@@ -157,84 +700,42 @@ def pnm_measurement(measurement_type, mac_address):
                 logical_ch_ifindex=logical_ch_ifindex
             )
             
-            # Store UTSC config in Redis for later plot generation
-            try:
-                redis_client.setex(
-                    f'utsc_config:{mac_address}',
-                    3600,  # 1 hour TTL
-                    json.dumps({
-                        'span_hz': span_hz,
-                        'center_freq_hz': center_freq_hz,
-                        'num_bins': num_bins
-                    })
-                )
-            except Exception as e:
-                logger.warning(f"Failed to cache UTSC config: {e}")
-        elif measurement_type == 'channel_estimation':
-            result = client.get_channel_estimation(
-                mac_address, modem_ip, tftp_ip, community,
-                tftp_ipv6="::1", output_type=output_type
-            )
-        elif measurement_type == 'modulation_profile':
-            result = client.get_modulation_profile(
-                mac_address, modem_ip, tftp_ip, community,
-                tftp_ipv6="::1", output_type=output_type
-            )
-        elif measurement_type == 'fec_summary':
-            fec_type = data.get('fec_summary_type', 2)
-            result = client.get_fec_summary(
-                mac_address, modem_ip, tftp_ip, community,
-                tftp_ipv6="::1", fec_summary_type=fec_type, output_type=output_type
-            )
-        elif measurement_type == 'histogram':
-            duration = data.get('sample_duration', 60)
-            result = client.get_histogram(
-                mac_address, modem_ip, tftp_ip, community,
-                tftp_ipv6="::1", sample_duration=duration, output_type=output_type
-            )
-        elif measurement_type == 'constellation':
-            logger.info(f"=== CONSTELLATION DEBUG START ===")
-            logger.info(f"Requesting constellation for {mac_address} at {modem_ip}")
-            logger.info(f"Output type: {output_type}, Requested archive: {requested_archive}")
-            result = client.get_constellation_display(
-                mac_address, modem_ip, tftp_ip, community,
-                tftp_ipv6="::1", output_type=output_type
-            )
-            logger.info(f"=== CONSTELLATION RAW RESULT ===")
-            logger.info(f"Result type: {type(result)}")
-            if isinstance(result, dict):
-                logger.info(f"Result keys: {result.keys()}")
-                logger.info(f"Result status: {result.get('status')}")
-                logger.info(f"Result message: {result.get('message')}")
-                if 'data' in result:
-                    logger.info(f"Data keys: {result['data'].keys() if isinstance(result['data'], dict) else 'not a dict'}")
-            elif isinstance(result, bytes):
-                logger.info(f"Result is bytes, length: {len(result)}")
-            else:
-                logger.info(f"Result: {result}")
-            
-            # Generate matplotlib plots for constellation data (like other measurements)
-            # PyPNM returns: {data: [{channel_id, samples: [(I, Q), ...]}, ...]}
-            if isinstance(result, dict) and result.get('status') == 0:
-                raw_data = result.get('data', [])
-                if isinstance(raw_data, list) and len(raw_data) > 0:
-                    try:
-                        constellation_plots = generate_constellation_plots_from_data(raw_data, mac_address)
-                        if constellation_plots:
-                            # Add plots to result (like other measurements)
-                            if 'plots' not in result:
-                                result['plots'] = []
-                            result['plots'].extend(constellation_plots)
-                            logger.info(f"Generated {len(constellation_plots)} matplotlib constellation plots")
-                    except Exception as e:
-                        logger.error(f"Failed to generate constellation plots: {e}", exc_info=True)
-            
-            logger.info(f"=== CONSTELLATION DEBUG END ===")
-        elif measurement_type == 'us_pre_eq':
-            result = client.get_us_ofdma_pre_equalization(
+            # Store UTSC config in Redis for later plot generation, off the response path
+            _redis_write_executor.submit(_cache_utsc_config, mac_address, {
+                'span_hz': span_hz,
+                'center_freq_hz': center_freq_hz,
+                'num_bins': num_bins
+            })
+        elif measurement_type in MODEM_MEASUREMENTS:
+            method_name, extra_kwargs = MODEM_MEASUREMENTS[measurement_type]
+            result = getattr(client, method_name)(
                 mac_address, modem_ip, tftp_ip, community,
-                tftp_ipv6="::1", output_type=output_type
+                tftp_ipv6="::1", output_type=output_type, **extra_kwargs(data)
             )
+            if measurement_type == 'constellation':
+                # Raw result summary only when debugging; skips the formatting work otherwise
+                if logger.isEnabledFor(logging.DEBUG):
+                    if isinstance(result, dict):
+                        logger.debug("Constellation result for %s: status=%s message=%s keys=%s",
+                                     mac_address, result.get('status'), result.get('message'), list(result))
+                    else:
+                        logger.debug("Constellation result for %s: %s", mac_address, type(result).__name__)
+                
+                # Generate matplotlib plots for constellation data (like other measurements)
+                # PyPNM returns: {data: [{channel_id, samples: [(I, Q), ...]}, ...]}
+                if isinstance(result, dict) and result.get('status') == 0:
+                    raw_data = result.get('data', [])
+                    if isinstance(raw_data, list) and len(raw_data) > 0:
+                        try:
+                            constellation_plots = _render_constellation_plots(raw_data, mac_address)
+                            if constellation_plots:
+                                # Add plots to result (like other measurements)
+                                if 'plots' not in result:
+                                    result['plots'] = []
+                                result['plots'].extend(constellation_plots)
+                                logger.info(f"Generated {len(constellation_plots)} matplotlib constellation plots")
+                        except Exception as e:
+                            logger.error(f"Failed to generate constellation plots: {e}", exc_info=True)
         else:
             return jsonify({
                 "status": "error",
@@ -242,89 +743,66 @@ def pnm_measurement(measurement_type, mac_address):
             }), 400
         
         # Handle archive (tar.gz) response - fetch matplotlib plots from PyPNM
-        if requested_archive and isinstance(result, bytes):
-            # Check if the "bytes" is actually a JSON error response
-            if len(result) < 1000:
+        if requested_archive and isinstance(result, ArchiveDownload):
+            # The client streamed the download to a .part temp file; whatever goes
+            # wrong before it is moved into DATA_DIR, don't leave it behind
+            try:
+                # Check if the "archive" is actually a JSON error response
+                if result.size < 1000:
+                    try:
+                        error_json = json.loads(result.head.decode('utf-8'))
+                        if isinstance(error_json, dict) and error_json.get('status', 0) != 0:
+                            logger.error(f"PyPNM returned error: {error_json}")
+                            return jsonify({
+                                "status": error_json.get('status', 'error'),
+                                "message": error_json.get('message', 'Measurement failed'),
+                                "mac_address": mac_address
+                            }), 400
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        pass  # Not JSON, continue processing as binary
+                
+                # PyPNM returns binary archive file (ZIP or tar.gz), told apart by magic bytes
+                archive_ext = _archive_format(result.head)
+                
+                # Save archive file (already streamed to disk by the client)
+                timestamp = time.strftime('%Y%m%d_%H%M%S')
+                archive_filename = f"{measurement_type}_{mac_address}_{timestamp}.{archive_ext}"
+                archive_path = f"{DATA_DIR}/{archive_filename}"
+                
+                shutil.move(result.path, archive_path)
+            finally:
                 try:
-                    error_json = json.loads(result.decode('utf-8'))
-                    if isinstance(error_json, dict) and error_json.get('status', 0) != 0:
-                        logger.error(f"PyPNM returned error: {error_json}")
-                        return jsonify({
-                            "status": error_json.get('status', 'error'),
-                            "message": error_json.get('message', 'Measurement failed'),
-                            "mac_address": mac_address
-                        }), 400
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    pass  # Not JSON, continue processing as binary
-            
-            # PyPNM returns binary archive file (ZIP or tar.gz)
-            import tarfile
-            import zipfile
-            import io
-            import base64
-            from datetime import datetime
-            
-            # Detect archive type
-            is_zip = result.startswith(b'PK')  # ZIP magic number
-            
-            # Save archive file
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            archive_ext = 'zip' if is_zip else 'tar.gz'
-            archive_filename = f"{measurement_type}_{mac_address}_{timestamp}.{archive_ext}"
-            archive_path = f"/app/data/{archive_filename}"
-            
-            with open(archive_path, 'wb') as f:
-                f.write(result)
+                    os.unlink(result.path)
+                except FileNotFoundError:
+                    pass  # Moved into place
             
             # Extract PNG images and JSON from archive
             plots = []
             json_data = None
+            plot_subdir = archive_filename.split('.', 1)[0]
             try:
-                if is_zip:
-                    # Handle ZIP archive
-                    with zipfile.ZipFile(io.BytesIO(result), 'r') as zf:
-                        archive_files = zf.namelist()
-                        logger.info(f"ZIP archive contains {len(archive_files)} files")
-                        for filename in archive_files:
-                            if filename.endswith('.png'):
-                                img_data = zf.read(filename)
-                                plots.append({
-                                    'filename': filename.split('/')[-1],  # Get basename
-                                    'data': base64.b64encode(img_data).decode('utf-8')
-                                })
-                            elif filename.endswith('.json'):
-                                json_content = zf.read(filename).decode('utf-8')
-                                json_data = json.loads(json_content)
-                        logger.info(f"Extracted {len(plots)} PNG plots from ZIP")
-                else:
-                    # Handle tar.gz archive
-                    with tarfile.open(fileobj=io.BytesIO(result), mode='r:gz') as tf:
-                        archive_files = tf.getnames()
-                        logger.info(f"TAR archive contains {len(archive_files)} files")
-                        for filename in archive_files:
-                            if filename.endswith('.png'):
-                                member = tf.getmember(filename)
-                                img_data = tf.extractfile(member).read()
-                                plots.append({
-                                    'filename': filename.split('/')[-1],  # Get basename
-                                    'data': base64.b64encode(img_data).decode('utf-8')
-                                })
-                            elif filename.endswith('.json'):
-                                member = tf.getmember(filename)
-                                json_content = tf.extractfile(member).read().decode('utf-8')
-                                json_data = json.loads(json_content)
-                        logger.info(f"Extracted {len(plots)} PNG plots from TAR")
+                archive_count = 0
+                for filename, src in _iter_archive_files(archive_path, archive_ext):
+                    archive_count += 1
+                    if filename.endswith('.png'):
+                        plot = {'filename': filename.split('/')[-1]}  # Get basename
+                        _attach_archive_plot(plot, src, plot_subdir, inline_plots)
+                        plots.append(plot)
+                    elif filename.endswith('.json'):
+                        json_data = json.load(src)
+                logger.info(f"{archive_ext} archive contains {archive_count} files, "
+                            f"extracted {len(plots)} PNG plots")
             except Exception as e:
                 logger.error(f"Failed to extract from archive: {e}")
             
             # For constellation, generate matplotlib plots from extracted JSON data
             # (PyPNM constellation archives don't contain pre-generated PNGs)
             if measurement_type == 'constellation' and json_data and len(plots) == 0:
-                logger.info(f"Generating constellation plots from extracted JSON data")
+                logger.info("Generating constellation plots from extracted JSON data")
                 raw_data = json_data if isinstance(json_data, list) else json_data.get('data', [])
                 if isinstance(raw_data, list) and len(raw_data) > 0:
                     try:
-                        constellation_plots = generate_constellation_plots_from_data(raw_data, mac_address)
+                        constellation_plots = _render_constellation_plots(raw_data, mac_address)
                         if constellation_plots:
                             plots.extend(constellation_plots)
                             logger.info(f"Generated {len(constellation_plots)} matplotlib constellation plots")
@@ -356,108 +834,18 @@ def pnm_measurement(measurement_type, mac_address):
         
         # Handle archive (ZIP) response - fetch matplotlib plots from PyPNM
         if requested_archive and result.get('status') == 0:
-            # PyPNM returns archive data, extract plots and save ZIP
-            import zipfile
-            import io
-            import base64
-            from datetime import datetime
-            
-            # Get the archive data from PyPNM
-            archive_data = result.get('archive_data')
-            if archive_data:
-                # Save ZIP and extract plot images
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                zip_filename = f"{measurement_type}_{mac_address}_{timestamp}.zip"
-                zip_path = f"/app/data/{zip_filename}"
-                
-                # Write ZIP file
-                with open(zip_path, 'wb') as f:
-                    f.write(base64.b64decode(archive_data) if isinstance(archive_data, str) else archive_data)
-                
-                # Extract PNG images from ZIP
-                plots = []
-                try:
-                    with zipfile.ZipFile(zip_path, 'r') as zf:
-                        for filename in zf.namelist():
-                            if filename.endswith('.png'):
-                                img_data = zf.read(filename)
-                                plots.append({
-                                    'filename': filename,
-                                    'data': base64.b64encode(img_data).decode('utf-8')
-                                })
-                except Exception as e:
-                    logger.error(f"Failed to extract plots: {e}")
-                
-                return jsonify({
-                    "status": 0,
-                    "message": result.get('message', 'Archive generated successfully'),
-                    "output_type": "archive",
-                    "zip_file": zip_filename,
-                    "download_url": f"/api/pypnm/download/{zip_filename}",
-                    "plots": plots,
-                    "data": result.get('data', {})
-                })
-            
-            # Archive data not available, return JSON
-            # But fetch matplotlib plots if they were generated
-            import glob
-            import os
-            import base64
-            import time
-            
+            # PyPNM returned JSON instead of an archive (archives arrive as
+            # ArchiveDownload above); fetch the matplotlib plots it generated
             logger.info(f"=== Plot Fetching Debug ===")
             logger.info(f"requested_archive: {requested_archive}")
             logger.info(f"result status: {result.get('status')}")
             
-            plots = []
-            if result.get('status') == 0:
-                # Give PyPNM a moment to finish writing files
-                time.sleep(1)
-                
-                # Look for plots in /pypnm-data/png/
-                plot_dir = "/pypnm-data/png"
-                logger.info(f"Plot dir exists: {os.path.exists(plot_dir)}")
-                
-                if os.path.exists(plot_dir):
-                    # Find recent plots for this modem
-                    mac_clean = mac_address.replace(':', '')
-                    pattern = f"{plot_dir}/{mac_clean}*.png"
-                    plot_files = glob.glob(pattern)
-                    logger.info(f"Pattern: {pattern}")
-                    logger.info(f"Found {len(plot_files)} total files")
-                    
-                    # Get files modified in the last 60 seconds
-                    recent_time = time.time() - 60
-                    plot_files = [f for f in plot_files if os.path.getmtime(f) > recent_time]
-                    logger.info(f"Found {len(plot_files)} recent files (last 60s)")
-                    plot_files.sort(key=os.path.getmtime, reverse=True)
-                    
-                    for filepath in plot_files[:10]:  # Max 10 plots
-                        try:
-                            with open(filepath, 'rb') as f:
-                                img_data = f.read()
-                                plots.append({
-                                    'filename': os.path.basename(filepath),
-                                    'data': base64.b64encode(img_data).decode('utf-8')
-                                })
-                                logger.info(f"Added plot: {os.path.basename(filepath)}")
-                        except Exception as e:
-                            logger.error(f"Failed to read plot {filepath}: {e}")
-            
+            # Plots written since the capture started, once PyPNM has finished writing them
+            plots = _recent_plots(mac_clean, capture_start_ns, inline_plots, wait=True, watch=plot_watch)
             logger.info(f"Returning {len(plots)} plots")
             
-            # For spectrum analyzer, generate matplotlib plots from the JSON data
-            if measurement_type == 'spectrum' and result.get('status') == 0:
-                spectrum_data = result.get('data', {})
-                if spectrum_data:
-                    logger.info(f"Generating spectrum plot for {mac_address}")
-                    try:
-                        spectrum_plot = generate_spectrum_plot_from_data(spectrum_data, mac_address)
-                        if spectrum_plot:
-                            plots.append(spectrum_plot)
-                            logger.info(f"Successfully generated spectrum plot: {spectrum_plot['filename']}")
-                    except Exception as e:
-                        logger.error(f"Failed to generate spectrum plot: {e}", exc_info=True)
+            if measurement_type == 'spectrum':
+                _append_spectrum_plot(plots, result, mac_address)
             
             return jsonify({
                 "status": 0,
@@ -471,50 +859,18 @@ def pnm_measurement(measurement_type, mac_address):
             return jsonify(result), 500
         
         # Fetch matplotlib plots for successful measurements (regardless of output_type)
-        import glob
-        import os
-        import base64
-        import time
-        
-        plots = []
-        plot_dir = "/pypnm-data/png"
-        if os.path.exists(plot_dir):
-            mac_clean = mac_address.replace(':', '')
-            pattern = f"{plot_dir}/{mac_clean}*.png"
-            plot_files = glob.glob(pattern)
-            
-            # Get files modified in the last 120 seconds
-            recent_time = time.time() - 120
-            plot_files = [f for f in plot_files if os.path.getmtime(f) > recent_time]
-            plot_files.sort(key=os.path.getmtime, reverse=True)
-            
-            for filepath in plot_files[:10]:
-                try:
-                    with open(filepath, 'rb') as f:
-                        img_data = f.read()
-                        plots.append({
-                            'filename': os.path.basename(filepath),
-                            'data': base64.b64encode(img_data).decode('utf-8')
-                        })
-                except Exception as e:
-                    logger.error(f"Failed to read plot {filepath}: {e}")
+        plots = _recent_plots(mac_clean, time.time_ns() - 120 * 1_000_000_000, inline_plots)
         
-        # For spectrum analyzer, generate matplotlib plots from the JSON data
-        if measurement_type == 'spectrum' and result.get('status') == 0:
-            spectrum_data = result.get('data', {})
-            if spectrum_data:
-                logger.info(f"Generating spectrum plot for {mac_address}")
-                try:
-                    spectrum_plot = generate_spectrum_plot_from_data(spectrum_data, mac_address)
-                    if spectrum_plot:
-                        plots.append(spectrum_plot)
-                        logger.info(f"Successfully generated spectrum plot: {spectrum_plot['filename']}")
-                except Exception as e:
-                    logger.error(f"Failed to generate spectrum plot: {e}")
+        if measurement_type == 'spectrum':
+            _append_spectrum_plot(plots, result, mac_address)
         
         # Add plots to result
         result['plots'] = plots
-            
+        
+        if cache_key is not None:
+            _ttl_cache_put(_measurement_cache, _measurement_cache_lock, cache_key, result,
+                           MEASUREMENT_CACHE_TTL, MEASUREMENT_CACHE_SIZE)
+        
         return jsonify(result)
         
     except Exception as e:
@@ -523,6 +879,17 @@ def pnm_measurement(measurement_type, mac_address):
             "status": "error",
             "message": str(e)
         }), 500
+    finally:
+        if plot_watch is not None:
+            plot_watch.close()
+
+
+# Recent channel-stats payloads keyed by (mac, modem_ip, community) -> (expires_at, payload),
+# so dashboards polling every few seconds don't repeat four SNMP walks
+_channel_stats_cache: Dict[tuple, tuple] = {}
+_channel_stats_lock = threading.Lock()
+CHANNEL_STATS_TTL = 5  # Seconds
+CHANNEL_STATS_CACHE_SIZE = 512
 
 
 @pypnm_bp.route('/channel-stats/<mac_address>', methods=['POST'])
@@ -535,8 +902,6 @@ def channel_stats(mac_address):
     - Active profiles
     - Signal quality metrics
     """
-    from app.core.pypnm_client import PyPNMClient
-    
     data = request.get_json() or {}
     modem_ip = data.get('modem_ip')
     community = data.get('community', get_default_community())
@@ -544,48 +909,66 @@ def channel_stats(mac_address):
     if not modem_ip:
         return jsonify({"status": "error", "message": "modem_ip required"}), 400
     
-    client = PyPNMClient()
+    # ?nocache=1 forces a fresh read from the modem
+    cache_key = (mac_address, modem_ip, community)
+    if request.args.get('nocache') != '1':
+        cached = _ttl_cache_get(_channel_stats_cache, cache_key)
+        if cached is not None:
+            return jsonify(cached)
+    
+    client = get_pypnm_client()
     
     try:
-        # Get all channel stats
-        ds_scqam = client.get_ds_scqam_stats(mac_address, modem_ip, community)
-        ds_ofdm = client.get_ds_ofdm_stats(mac_address, modem_ip, community)
-        us_atdma = client.get_us_atdma_stats(mac_address, modem_ip, community)
-        us_ofdma = client.get_us_ofdma_stats(mac_address, modem_ip, community)
+        # Get all channel stats; the four SNMP walks run in parallel
+        futures = [
+            channel_stats_executor.submit(fetch, mac_address, modem_ip, community)
+            for fetch in (client.get_ds_scqam_stats, client.get_ds_ofdm_stats,
+                          client.get_us_atdma_stats, client.get_us_ofdma_stats)
+        ]
+        ds_scqam, ds_ofdm, us_atdma, us_ofdma = (future.result() for future in futures)
+        
+        # Process and enhance data with profile info (extract each list once)
+        scqam_channels = _extract_scqam_channels(ds_scqam)
+        ofdm_channels = _extract_ofdm_channels(ds_ofdm)
+        atdma_channels = _extract_atdma_channels(us_atdma)
+        ofdma_channels = _extract_ofdma_channels(us_ofdma)
         
-        # Process and enhance data with profile info
         downstream = {
             "scqam": {
                 "type": "SC-QAM (DOCSIS 3.0)",
-                "channels": _extract_scqam_channels(ds_scqam),
-                "count": len(_extract_scqam_channels(ds_scqam))
+                "channels": scqam_channels,
+                "count": len(scqam_channels)
             },
             "ofdm": {
                 "type": "OFDM (DOCSIS 3.1)",
-                "channels": _extract_ofdm_channels(ds_ofdm),
-                "count": len(_extract_ofdm_channels(ds_ofdm))
+                "channels": ofdm_channels,
+                "count": len(ofdm_channels)
             }
         }
         
         upstream = {
             "atdma": {
                 "type": "ATDMA (DOCSIS 3.0)",
-                "channels": _extract_atdma_channels(us_atdma),
-                "count": len(_extract_atdma_channels(us_atdma))
+                "channels": atdma_channels,
+                "count": len(atdma_channels)
             },
             "ofdma": {
                 "type": "OFDMA (DOCSIS 3.1)",
-                "channels": _extract_ofdma_channels(us_ofdma),
-                "count": len(_extract_ofdma_channels(us_ofdma))
+                "channels": ofdma_channels,
+                "count": len(ofdma_channels)
             }
         }
         
-        return jsonify({
+        payload = {
             "mac_address": mac_address,
             "status": 0,
             "downstream": downstream,
             "upstream": upstream
-        })
+        }
+        _ttl_cache_put(_channel_stats_cache, _channel_stats_lock, cache_key, payload,
+                       CHANNEL_STATS_TTL, CHANNEL_STATS_CACHE_SIZE)
+        
+        return jsonify(payload)
         
     except Exception as e:
         logger.error(f"Channel stats failed: {e}")
@@ -595,6 +978,131 @@ def channel_stats(mac_address):
         }), 500
 
 
+# Scale factors for DOCSIS MIB fields reported in tenths (TenthdBmV / TenthdB).
+# Generic field names from PyPNM are already in dBmV / dB.
+_SCALE = {
+    'docsIf31CmDsOfdmChannelPower': 0.1,
+    'docsIf31CmDsOfdmChanMer': 0.1,
+    'docsIf31CmDsOfdmChanRxMer': 0.1,
+}
+
+# Field names tried in order for each value (DOCSIS MIB name first, then PyPNM's generic names)
+_SCQAM_FREQ_FIELDS = ('docsIfDownChannelFrequency', 'frequency')
+_SCQAM_MODULATION_FIELDS = ('docsIfDownChannelModulation', 'modulation')
+_SCQAM_POWER_FIELDS = ('docsIfDownChannelPower', 'power')
+_SCQAM_SNR_FIELDS = ('docsIf3CmStatusUsSnr', 'rxMer', 'snr')
+_SCQAM_CHANNEL_ID_FIELDS = ('docsIfDownChannelId', 'ifIndex')
+
+_OFDM_FREQ_FIELDS = ('docsIf31CmDsOfdmChanSubcarrierZeroFreq', 'docsIf31CmDsOfdmChannelLowerFrequency',
+                     'lowerFrequency', 'frequency')
+_OFDM_POWER_FIELDS = ('docsIf31CmDsOfdmChannelPower', 'power')
+_OFDM_MER_FIELDS = ('docsIf31CmDsOfdmChanMer', 'docsIf31CmDsOfdmChanRxMer', 'mer', 'rxMer')
+_OFDM_MODULATION_FIELDS = ('docsIf31CmDsOfdmChanModulationFormat', 'modulationFormat', 'modulation')
+_OFDM_PROFILE_FIELDS = ('docsIf31CmDsOfdmProfileStatsProfileList', 'profiles', 'activeProfiles')
+_OFDM_PARTIAL_FIELDS = ('docsIf31CmDsOfdmChanIsPartialSvc', 'isPartialService', 'partialService')
+_OFDM_CHANNEL_ID_FIELDS = ('docsIf31CmDsOfdmChanChannelId', 'channelId')
+
+_ATDMA_FREQ_FIELDS = ('docsIfUpChannelFrequency', 'frequency')
+_ATDMA_MODULATION_FIELDS = ('docsIfUpChannelType', 'channelType', 'modulation')
+_ATDMA_POWER_FIELDS = ('docsIf3CmStatusUsTxPower', 'txPower', 'power')
+_ATDMA_CHANNEL_ID_FIELDS = ('docsIfUpChannelId', 'ifIndex')
+
+_OFDMA_FREQ_FIELDS = ('docsIf31CmUsOfdmaChanSubcarrierZeroFreq', 'docsIf31CmUsOfdmaChannelConfiguredCenterFrequency',
+                      'configuredCenterFrequency', 'centerFrequency', 'frequency')
+_OFDMA_PROFILE_FIELDS = ('docsIf31CmUsOfdmaProfileStatsList', 'activeProfiles', 'profiles')
+_OFDMA_CHANNEL_ID_FIELDS = ('docsIf31CmUsOfdmaChanChannelId', 'channelId')
+
+_MISSING = object()
+
+
+def _first(getter, keys, default=None):
+    """Return (key, value) for the first of keys present via getter, else (None, default)."""
+    for key in keys:
+        value = getter(key, _MISSING)
+        if value is not _MISSING:
+            return key, value
+    return None, default
+
+
+def _first_value(getter, keys, default=None):
+    """Return the value of the first of keys present via getter, else default."""
+    for key in keys:
+        value = getter(key, _MISSING)
+        if value is not _MISSING:
+            return value
+    return default
+
+
+def _channel_id(ch: Dict[str, Any], getter, keys):
+    """Channel ID from PyPNM's top-level 'channel_id', else the first of keys in the entry."""
+    channel_id = ch.get('channel_id', _MISSING)
+    if channel_id is not _MISSING:
+        return channel_id
+    return _first_value(getter, keys)
+
+
+def _profile_id(p) -> Optional[int]:
+    """Profile ID from a profile list entry ({'profileId': n} or a bare int), else None."""
+    if type(p) is dict:
+        return p.get('profileId', p.get('profile_id'))
+    if type(p) is int:
+        return p
+    return None
+
+
+@dataclass(slots=True)
+class ScqamChannel:
+    """SC-QAM downstream channel as returned by channel-stats."""
+    channel_id: Optional[int]
+    frequency: Any
+    frequency_mhz: Any
+    modulation: Any
+    power: Any
+    snr: Any
+
+
+@dataclass(slots=True)
+class OfdmChannel:
+    """OFDM downstream channel as returned by channel-stats."""
+    channel_id: Optional[int]
+    frequency: Any
+    frequency_mhz: Optional[float]
+    plc_freq_mhz: Optional[float]
+    bandwidth_mhz: Optional[float]
+    num_subcarriers: int
+    subcarrier_spacing_khz: Optional[float]
+    power_dbmv: Optional[float]
+    mer_db: Optional[float]
+    modulation: Any
+    profiles: List[int]
+    is_partial: bool
+    ncp_profile: bool
+    active_profiles: int
+
+
+@dataclass(slots=True)
+class AtdmaChannel:
+    """ATDMA upstream channel as returned by channel-stats."""
+    channel_id: Optional[int]
+    frequency: Any
+    frequency_mhz: Any
+    modulation: Any
+    power: Any
+
+
+@dataclass(slots=True)
+class OfdmaChannel:
+    """OFDMA upstream channel as returned by channel-stats."""
+    channel_id: Optional[int]
+    frequency: Any
+    frequency_mhz: Any
+    bandwidth: Optional[float]
+    bandwidth_mhz: Optional[float]
+    num_subcarriers: int
+    tx_power: Any
+    profiles: List[int]
+
+
 def _extract_scqam_channels(data: Dict[str, Any]) -> list:
     """Extract SC-QAM channel info."""
     if data.get('status') != 0:
@@ -609,33 +1117,28 @@ def _extract_scqam_channels(data: Dict[str, Any]) -> list:
         for ch in results:
             # Data may be nested in 'entry' object (like OFDM/OFDMA)
             entry = ch.get('entry', ch)
+            g = entry.get  # Local alias for the many field lookups below
             
             # Get frequency - try various DOCSIS 3.0 field names
-            freq = entry.get('docsIfDownChannelFrequency',
-                   entry.get('frequency', 0))
+            freq = _first_value(g, _SCQAM_FREQ_FIELDS, 0)
             
             # Get modulation
-            modulation = entry.get('docsIfDownChannelModulation',
-                         entry.get('modulation', ''))
+            modulation = _first_value(g, _SCQAM_MODULATION_FIELDS, '')
             
             # Get power
-            power = entry.get('docsIfDownChannelPower',
-                    entry.get('power', None))
+            power = _first_value(g, _SCQAM_POWER_FIELDS)
             
             # Get SNR/RxMER
-            snr = entry.get('docsIf3CmStatusUsSnr',
-                  entry.get('rxMer',
-                  entry.get('snr', None)))
+            snr = _first_value(g, _SCQAM_SNR_FIELDS)
             
-            channels.append({
-                'channel_id': ch.get('channel_id', entry.get('docsIfDownChannelId',
-                              entry.get('ifIndex'))),
-                'frequency': freq,
-                'frequency_mhz': round(freq / 1000000, 1) if freq and freq > 1000 else freq,
-                'modulation': modulation,
-                'power': power,
-                'snr': snr
-            })
+            channels.append(ScqamChannel(
+                channel_id=_channel_id(ch, g, _SCQAM_CHANNEL_ID_FIELDS),
+                frequency=freq,
+                frequency_mhz=round(freq / 1000000, 1) if freq and freq > 1000 else freq,
+                modulation=modulation,
+                power=power,
+                snr=snr
+            ))
         return channels
     
     return []
@@ -655,79 +1158,72 @@ def _extract_ofdm_channels(data: Dict[str, Any]) -> list:
         for ch in results:
             # Data may be nested in 'entry' object
             entry = ch.get('entry', ch)
+            g = entry.get  # Local alias for the many field lookups below
             
             # Get frequency - SubcarrierZeroFreq is the start frequency
-            freq = entry.get('docsIf31CmDsOfdmChanSubcarrierZeroFreq',
-                   entry.get('docsIf31CmDsOfdmChannelLowerFrequency',
-                   entry.get('lowerFrequency',
-                   entry.get('frequency', 0))))
+            freq = _first_value(g, _OFDM_FREQ_FIELDS, 0)
             
             # PLC frequency is the center/reference frequency
-            plc_freq = entry.get('docsIf31CmDsOfdmChanPlcFreq', 0)
+            plc_freq = g('docsIf31CmDsOfdmChanPlcFreq', 0)
             
             # Calculate bandwidth from subcarriers
-            num_subcarriers = entry.get('docsIf31CmDsOfdmChanNumActiveSubcarriers', 0)
-            subcarrier_spacing = entry.get('docsIf31CmDsOfdmChanSubcarrierSpacing', 50000)  # Default 50kHz
+            num_subcarriers = g('docsIf31CmDsOfdmChanNumActiveSubcarriers', 0)
+            subcarrier_spacing = g('docsIf31CmDsOfdmChanSubcarrierSpacing', 50000)  # Default 50kHz
             bandwidth = (num_subcarriers * subcarrier_spacing) if num_subcarriers else 0
             
-            # Get power level (in tenths of dBmV)
-            power_raw = entry.get('docsIf31CmDsOfdmChannelPower',
-                        entry.get('power', 0))
-            power_dbmv = power_raw / 10 if power_raw and abs(power_raw) > 100 else power_raw
+            # Get power level (MIB field is in tenths of dBmV)
+            power_field, power_raw = _first(g, _OFDM_POWER_FIELDS, 0)
+            power_dbmv = power_raw * _SCALE.get(power_field, 1.0) if power_raw else power_raw
             
-            # Get MER (in tenths of dB)
-            mer_raw = entry.get('docsIf31CmDsOfdmChanMer',
-                      entry.get('docsIf31CmDsOfdmChanRxMer',
-                      entry.get('mer', entry.get('rxMer', 0))))
-            mer_db = mer_raw / 10 if mer_raw and abs(mer_raw) > 100 else mer_raw
+            # Get MER (MIB fields are in tenths of dB)
+            mer_field, mer_raw = _first(g, _OFDM_MER_FIELDS, 0)
+            mer_db = mer_raw * _SCALE.get(mer_field, 1.0) if mer_raw else mer_raw
             
             # Get modulation profile - can be primary modulation type
-            modulation = entry.get('docsIf31CmDsOfdmChanModulationFormat',
-                         entry.get('modulationFormat',
-                         entry.get('modulation', None)))
+            modulation = _first_value(g, _OFDM_MODULATION_FIELDS)
             
             # Try various field names for profiles
-            profiles_raw = entry.get('docsIf31CmDsOfdmProfileStatsProfileList', 
-                          entry.get('profiles', 
-                          entry.get('activeProfiles', [])))
+            profiles_raw = _first_value(g, _OFDM_PROFILE_FIELDS, [])
             
-            # Parse profiles
+            # Parse profiles in a single pass, splitting out the NCP profile (255)
+            profiles = []
+            has_ncp = False
             if isinstance(profiles_raw, str):
-                profiles = [int(p.strip()) for p in profiles_raw.split(',') if p.strip().isdigit()]
+                for tok in profiles_raw.split(','):
+                    tok = tok.strip()
+                    if tok.isdigit():
+                        pid = int(tok)
+                        if pid == 255:
+                            has_ncp = True
+                        else:
+                            profiles.append(pid)
             elif isinstance(profiles_raw, list):
-                profiles = []
                 for p in profiles_raw:
-                    if isinstance(p, dict):
-                        pid = p.get('profileId', p.get('profile_id'))
-                        if pid is not None and pid != 255:
-                            profiles.append(pid)
-                    elif isinstance(p, int) and p != 255:
-                        profiles.append(p)
-            else:
-                profiles = []
+                    pid = _profile_id(p)
+                    if pid == 255:
+                        has_ncp = True
+                    elif pid is not None:
+                        profiles.append(pid)
             
             # Check for partial service / NCP mode
-            is_partial = entry.get('docsIf31CmDsOfdmChanIsPartialSvc',
-                         entry.get('isPartialService',
-                         entry.get('partialService', False)))
+            is_partial = _first_value(g, _OFDM_PARTIAL_FIELDS, False)
             
-            channels.append({
-                'channel_id': ch.get('channel_id', entry.get('docsIf31CmDsOfdmChanChannelId', 
-                              entry.get('channelId'))),
-                'frequency': freq,
-                'frequency_mhz': round(freq / 1000000, 1) if freq else None,
-                'plc_freq_mhz': round(plc_freq / 1000000, 1) if plc_freq else None,
-                'bandwidth_mhz': round(bandwidth / 1000000, 1) if bandwidth else None,
-                'num_subcarriers': num_subcarriers,
-                'subcarrier_spacing_khz': subcarrier_spacing / 1000 if subcarrier_spacing else None,
-                'power_dbmv': round(power_dbmv, 1) if power_dbmv else None,
-                'mer_db': round(mer_db, 1) if mer_db else None,
-                'modulation': modulation,
-                'profiles': profiles,
-                'is_partial': bool(is_partial),
-                'ncp_profile': 255 in [p.get('profileId', p) if isinstance(p, dict) else p for p in (profiles_raw if isinstance(profiles_raw, list) else [])],
-                'active_profiles': len(profiles)
-            })
+            channels.append(OfdmChannel(
+                channel_id=_channel_id(ch, g, _OFDM_CHANNEL_ID_FIELDS),
+                frequency=freq,
+                frequency_mhz=round(freq / 1000000, 1) if freq else None,
+                plc_freq_mhz=round(plc_freq / 1000000, 1) if plc_freq else None,
+                bandwidth_mhz=round(bandwidth / 1000000, 1) if bandwidth else None,
+                num_subcarriers=num_subcarriers,
+                subcarrier_spacing_khz=subcarrier_spacing / 1000 if subcarrier_spacing else None,
+                power_dbmv=round(power_dbmv, 1) if power_dbmv else None,
+                mer_db=round(mer_db, 1) if mer_db else None,
+                modulation=modulation,
+                profiles=profiles,
+                is_partial=bool(is_partial),
+                ncp_profile=has_ncp,
+                active_profiles=len(profiles)
+            ))
         return channels
     
     return []
@@ -747,29 +1243,24 @@ def _extract_atdma_channels(data: Dict[str, Any]) -> list:
         for ch in results:
             # Data may be nested in 'entry' object (like OFDM/OFDMA)
             entry = ch.get('entry', ch)
+            g = entry.get  # Local alias for the many field lookups below
             
             # Get frequency - try various DOCSIS 3.0 field names
-            freq = entry.get('docsIfUpChannelFrequency',
-                   entry.get('frequency', 0))
+            freq = _first_value(g, _ATDMA_FREQ_FIELDS, 0)
             
             # Get modulation/channel type
-            modulation = entry.get('docsIfUpChannelType',
-                         entry.get('channelType',
-                         entry.get('modulation', '')))
+            modulation = _first_value(g, _ATDMA_MODULATION_FIELDS, '')
             
             # Get TX power
-            tx_power = entry.get('docsIf3CmStatusUsTxPower',
-                       entry.get('txPower',
-                       entry.get('power', None)))
+            tx_power = _first_value(g, _ATDMA_POWER_FIELDS)
             
-            channels.append({
-                'channel_id': ch.get('channel_id', entry.get('docsIfUpChannelId',
-                              entry.get('ifIndex'))),
-                'frequency': freq,
-                'frequency_mhz': round(freq / 1000000, 1) if freq and freq > 1000 else freq,
-                'modulation': modulation,
-                'power': tx_power
-            })
+            channels.append(AtdmaChannel(
+                channel_id=_channel_id(ch, g, _ATDMA_CHANNEL_ID_FIELDS),
+                frequency=freq,
+                frequency_mhz=round(freq / 1000000, 1) if freq and freq > 1000 else freq,
+                modulation=modulation,
+                power=tx_power
+            ))
         return channels
     
     return []
@@ -789,122 +1280,272 @@ def _extract_ofdma_channels(data: Dict[str, Any]) -> list:
         for ch in results:
             # Data may be nested in 'entry' object
             entry = ch.get('entry', ch)
+            g = entry.get  # Local alias for the many field lookups below
             
             # Get frequency - SubcarrierZeroFreq is the start frequency
-            freq = entry.get('docsIf31CmUsOfdmaChanSubcarrierZeroFreq',
-                   entry.get('docsIf31CmUsOfdmaChannelConfiguredCenterFrequency',
-                   entry.get('configuredCenterFrequency',
-                   entry.get('centerFrequency',
-                   entry.get('frequency', 0)))))
+            freq = _first_value(g, _OFDMA_FREQ_FIELDS, 0)
             
             # Calculate bandwidth from subcarriers
-            num_subcarriers = entry.get('docsIf31CmUsOfdmaChanNumActiveSubcarriers', 0)
+            num_subcarriers = g('docsIf31CmUsOfdmaChanNumActiveSubcarriers', 0)
             # OFDMA subcarrier spacing is in kHz (usually 25 or 50 kHz)
-            subcarrier_spacing_khz = entry.get('docsIf31CmUsOfdmaChanSubcarrierSpacing', 50)
+            subcarrier_spacing_khz = g('docsIf31CmUsOfdmaChanSubcarrierSpacing', 50)
             bandwidth = (num_subcarriers * subcarrier_spacing_khz * 1000) if num_subcarriers else 0
             
             # Get TX power
-            tx_power = entry.get('docsIf31CmUsOfdmaChanTxPower', None)
+            tx_power = g('docsIf31CmUsOfdmaChanTxPower', None)
             
             # Get profiles
-            profiles_raw = entry.get('docsIf31CmUsOfdmaProfileStatsList',
-                          entry.get('activeProfiles',
-                          entry.get('profiles', [])))
+            profiles_raw = _first_value(g, _OFDMA_PROFILE_FIELDS, [])
             
+            # Parse profiles in a single pass
+            profiles = []
             if isinstance(profiles_raw, str):
-                profiles = [int(p.strip()) for p in profiles_raw.split(',') if p.strip().isdigit()]
+                for tok in profiles_raw.split(','):
+                    tok = tok.strip()
+                    if tok.isdigit():
+                        profiles.append(int(tok))
             elif isinstance(profiles_raw, list):
-                profiles = []
                 for p in profiles_raw:
-                    if isinstance(p, dict):
-                        pid = p.get('profileId', p.get('profile_id'))
-                        if pid is not None:
-                            profiles.append(pid)
-                    elif isinstance(p, int):
-                        profiles.append(p)
-            else:
-                profiles = []
+                    pid = _profile_id(p)
+                    if pid is not None:
+                        profiles.append(pid)
             
-            channels.append({
-                'channel_id': ch.get('channel_id', entry.get('docsIf31CmUsOfdmaChanChannelId',
-                              entry.get('channelId'))),
-                'frequency': freq,
-                'frequency_mhz': round(freq / 1000000, 1) if freq and freq > 1000 else freq,
-                'bandwidth': round(bandwidth / 1000000, 1) if bandwidth else None,
-                'bandwidth_mhz': round(bandwidth / 1000000, 1) if bandwidth else None,
-                'num_subcarriers': num_subcarriers,
-                'tx_power': tx_power,
-                'profiles': profiles
-            })
+            channels.append(OfdmaChannel(
+                channel_id=_channel_id(ch, g, _OFDMA_CHANNEL_ID_FIELDS),
+                frequency=freq,
+                frequency_mhz=round(freq / 1000000, 1) if freq and freq > 1000 else freq,
+                bandwidth=round(bandwidth / 1000000, 1) if bandwidth else None,
+                bandwidth_mhz=round(bandwidth / 1000000, 1) if bandwidth else None,
+                num_subcarriers=num_subcarriers,
+                tx_power=tx_power,
+                profiles=profiles
+            ))
         return channels
     
     return []
 
 
+# PyPNM data directories cleaned up by housekeeping
+HOUSEKEEPING_DIRS = [
+    '/app/.data/pnm',
+    '/app/.data/csv',
+    '/app/.data/json',
+    '/app/.data/png',
+    '/app/.data/archive',
+    ARCHIVE_PLOT_DIR
+]
+
+# Housekeeping runs in a background worker; finished jobs are kept for polling
+_housekeeping_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='housekeeping')
+_housekeeping_jobs: Dict[str, Dict[str, Any]] = {}
+HOUSEKEEPING_JOB_TTL = 3600  # Seconds to keep finished job results
+HOUSEKEEPING_SCAN_WORKERS = 8  # Threads overlapping stat latency on mounted volumes
+
+# Expired files are unlinked off the housekeeping job thread
+_housekeeping_delete_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='hk-del')
+UNLINK_BATCH_SIZE = 128  # io_uring submission batch (and ring size)
+
+
+def _iter_files(root: str, recursive: bool = True):
+    """Yield a DirEntry for every regular file below root (os.scandir-based walk)."""
+    stack = [root]
+    while stack:
+        dir_path = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    # d_type from the directory listing: no stat for either check
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError as e:
+            logger.warning(f"Could not scan directory {dir_path}: {e}")
+
+
+def _scan_expired(root: str, recursive: bool, cutoff_mtime: float) -> list:
+    """Find files under root modified before cutoff_mtime; return (path, mtime, size) tuples."""
+    expired = []
+    for entry in _iter_files(root, recursive):
+        try:
+            # DirEntry caches the stat result: one syscall for age and size
+            st = entry.stat(follow_symlinks=False)
+            if st.st_mtime >= cutoff_mtime:
+                continue  # Common case: nothing else to compute
+            
+            expired.append((entry.path, st.st_mtime, st.st_size))
+        except Exception as e:
+            logger.warning(f"Could not process file {entry.path}: {e}")
+    return expired
+
+
+def _uring_unlink(paths: list) -> int:
+    """Unlink paths through io_uring, one submit syscall per UNLINK_BATCH_SIZE files."""
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    liburing.io_uring_queue_init(UNLINK_BATCH_SIZE, ring)
+    deleted = 0
+    try:
+        for start in range(0, len(paths), UNLINK_BATCH_SIZE):
+            batch = paths[start:start + UNLINK_BATCH_SIZE]
+            for index, path in enumerate(batch):
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_unlink(sqe, path)
+                liburing.io_uring_sqe_set_data64(sqe, index)
+            liburing.io_uring_submit(ring)
+            liburing.io_uring_wait_cqe_nr(ring, cqe, len(batch))
+            
+            ready = liburing.io_uring_cq_ready(ring)
+            for i in range(ready):
+                entry = cqe[i]
+                index = entry.user_data
+                try:
+                    entry.res  # Raises OSError for a failed unlink
+                    deleted += 1
+                except FileNotFoundError:
+                    pass  # Already gone
+                except OSError as e:
+                    logger.warning(f"Could not delete file {batch[index]}: {e}")
+            liburing.io_uring_cq_advance(ring, ready)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return deleted
+
+
+def _bulk_unlink(paths: list):
+    """Delete a batch of files, logging (not raising) per-file failures."""
+    if LIBURING_AVAILABLE:
+        try:
+            deleted = _uring_unlink(paths)
+            logger.info(f"Housekeeping deleted {deleted}/{len(paths)} files (io_uring)")
+            return
+        except Exception as e:
+            # e.g. io_uring blocked by the container seccomp profile, or a
+            # liburing binding error; unlinking an already-deleted file is a no-op
+            logger.warning(f"io_uring unlink failed, falling back to os.unlink: {e!r}")
+    
+    deleted = 0
+    for path in paths:
+        try:
+            os.unlink(path)
+            deleted += 1
+        except FileNotFoundError:
+            pass  # Already gone
+        except OSError as e:
+            logger.warning(f"Could not delete file {path}: {e}")
+    logger.info(f"Housekeeping deleted {deleted}/{len(paths)} files")
+
+
+def _log_delete_failure(future) -> None:
+    """Done-callback for queued _bulk_unlink batches: log an unexpected failure."""
+    e = future.exception()
+    if e is not None:
+        logger.error(f"Housekeeping delete batch failed: {e!r}")
+
+
+def _run_housekeeping(max_age_days: float, dry_run: bool) -> Dict[str, Any]:
+    """Delete (or list, for dry runs) files older than max_age_days."""
+    max_age_seconds = max_age_days * 24 * 60 * 60
+    current_time = time.time()
+    cutoff_mtime = current_time - max_age_seconds
+    
+    # Each data dir's own files form one task and every top-level
+    # subdirectory tree another, so the scans run in parallel
+    roots = []
+    for dir_path in HOUSEKEEPING_DIRS:
+        subdirs = []
+        try:
+            with os.scandir(dir_path) as it:
+                subdirs = [(e.path, True) for e in it if e.is_dir(follow_symlinks=False)]
+        except FileNotFoundError:
+            continue  # Data dir not created in this deployment
+        except OSError as e:
+            logger.warning(f"Could not scan directory {dir_path}: {e}")
+        roots.append((dir_path, False))
+        roots.extend(subdirs)
+    
+    expired = []
+    with ThreadPoolExecutor(max_workers=HOUSEKEEPING_SCAN_WORKERS,
+                            thread_name_prefix='housekeeping-scan') as pool:
+        futures = [pool.submit(_scan_expired, root, recursive, cutoff_mtime)
+                   for root, recursive in roots]
+        for future in futures:
+            expired.extend(future.result())
+    
+    # Unlinking thousands of files is slow; report the listing right away
+    # (as queued, not deleted) and log the outcome when the batch finishes
+    if not dry_run and expired:
+        future = _housekeeping_delete_executor.submit(_bulk_unlink, [path for path, _, _ in expired])
+        future.add_done_callback(_log_delete_failure)
+    
+    # Only the first 50 files are reported, so only those get formatted
+    deleted_files = [{
+        'path': path,
+        'age_days': round((current_time - mtime) / 86400, 1),
+        'size_mb': round(file_size / 1048576, 2)
+    } for path, mtime, file_size in expired[:50]]
+    total_size = sum(file_size for _, _, file_size in expired)
+    
+    return {
+        "status": "success",
+        "dry_run": dry_run,
+        "async_delete": not dry_run,
+        "file_count": len(expired),  # Queued for deletion unless dry_run
+        "total_size_mb": round(total_size / 1048576, 2),
+        "files": deleted_files
+    }
+
+
+def _housekeeping_job(job_id: str, max_age_days: float, dry_run: bool):
+    """Background worker body: run housekeeping and record the outcome."""
+    try:
+        result = _run_housekeeping(max_age_days, dry_run)
+    except Exception as e:
+        logger.error(f"Housekeeping failed: {e}")
+        result = {"status": "error", "message": str(e)}
+    result['job_id'] = job_id
+    result['finished_at'] = time.time()
+    _housekeeping_jobs[job_id] = result
+
+
 @pypnm_bp.route('/housekeeping', methods=['POST'])
 def housekeeping():
     """
-    Clean up old PNM files.
+    Clean up old PNM files in a background worker.
     
     POST body:
     {
         "max_age_days": 7,
         "dry_run": false
     }
+    
+    Returns 202 with a job_id; poll GET /api/pypnm/housekeeping/<job_id>
+    for the result.
     """
     data = request.get_json() or {}
-    max_age_days = data.get('max_age_days', 7)
     dry_run = data.get('dry_run', False)
     
+    # Validate here: the job runs after the 202 has been sent
     try:
-        import os
-        import time
-        from pathlib import Path
-        
-        # PyPNM data directories
-        data_dirs = [
-            '/app/.data/pnm',
-            '/app/.data/csv',
-            '/app/.data/json',
-            '/app/.data/png',
-            '/app/.data/archive'
-        ]
-        
-        max_age_seconds = max_age_days * 24 * 60 * 60
-        current_time = time.time()
-        deleted_files = []
-        total_size = 0
+        max_age_days = float(data.get('max_age_days', 7))
+    except (TypeError, ValueError):
+        max_age_days = None
+    if max_age_days is None or not 0 <= max_age_days < float('inf'):
+        return jsonify({"status": "error", "message": "max_age_days must be a non-negative number"}), 400
+    
+    try:
+        # Drop finished jobs nobody collected
+        expired = time.time() - HOUSEKEEPING_JOB_TTL
+        for old_id, job in list(_housekeeping_jobs.items()):
+            if job.get('finished_at', expired + 1) < expired:
+                _housekeeping_jobs.pop(old_id, None)
         
-        for dir_path in data_dirs:
-            if not os.path.exists(dir_path):
-                continue
-                
-            for root, dirs, files in os.walk(dir_path):
-                for filename in files:
-                    file_path = os.path.join(root, filename)
-                    try:
-                        file_age = current_time - os.path.getmtime(file_path)
-                        file_size = os.path.getsize(file_path)
-                        
-                        if file_age > max_age_seconds:
-                            if not dry_run:
-                                os.remove(file_path)
-                            deleted_files.append({
-                                'path': file_path,
-                                'age_days': round(file_age / 86400, 1),
-                                'size_mb': round(file_size / 1024 / 1024, 2)
-                            })
-                            total_size += file_size
-                    except Exception as e:
-                        logger.warning(f"Could not process file {file_path}: {e}")
+        job_id = uuid.uuid4().hex
+        _housekeeping_jobs[job_id] = {"status": "running", "job_id": job_id, "dry_run": dry_run}
+        _housekeeping_executor.submit(_housekeeping_job, job_id, max_age_days, dry_run)
         
-        return jsonify({
-            "status": "success",
-            "dry_run": dry_run,
-            "deleted_count": len(deleted_files),
-            "total_size_mb": round(total_size / 1024 / 1024, 2),
-            "files": deleted_files[:50]  # Return first 50
-        })
+        return jsonify(_housekeeping_jobs[job_id]), 202
         
     except Exception as e:
         logger.error(f"Housekeeping failed: {e}")
@@ -914,6 +1555,19 @@ def housekeeping():
         }), 500
 
 
+@pypnm_bp.route('/housekeeping/<job_id>', methods=['GET'])
+def housekeeping_status(job_id):
+    """
+    Get the status/result of a housekeeping job.
+    
+    GET /api/pypnm/housekeeping/<job_id>
+    """
+    job = _housekeeping_jobs.get(job_id)
+    if job is None:
+        return jsonify({"status": "error", "message": "Unknown housekeeping job"}), 404
+    return jsonify(job)
+
+
 @pypnm_bp.route('/download/<filename>', methods=['GET'])
 def download_archive(filename):
     """
@@ -921,19 +1575,83 @@ def download_archive(filename):
     
     GET /api/pypnm/download/<filename>
     """
-    import os
-    from flask import send_file
+    # Resolve once and refuse anything outside DATA_DIR ("..", symlinks)
+    file_path = os.path.realpath(os.path.join(DATA_DIR, filename))
+    if not file_path.startswith(_DATA_DIR_REAL + os.sep):
+        return jsonify({"status": "error", "message": "Invalid filename"}), 400
+    
+    mimetype = 'application/gzip' if filename.endswith('.tar.gz') else 'application/zip'
+    
+    # Behind nginx: let it serve the file from disk (sendfile) instead of Python
+    accel_prefix = current_app.config.get('ARCHIVE_ACCEL_REDIRECT_PREFIX')
+    if accel_prefix:
+        return Response(headers={
+            'X-Accel-Redirect': f"{accel_prefix.rstrip('/')}/{filename}",
+            'Content-Type': mimetype,
+            'Content-Disposition': f'attachment; filename="{filename}"'
+        })
     
-    file_path = f"/app/data/{filename}"
-    if not os.path.exists(file_path):
+    # send_from_directory safe-joins the name and hands the open file to
+    # wsgi.file_wrapper, which gunicorn serves with sendfile(2);
+    # conditional/etag/Last-Modified enable 304 and Range requests.
+    try:
+        return send_from_directory(
+            DATA_DIR,
+            filename,
+            mimetype=mimetype,
+            as_attachment=True,
+            download_name=filename,
+            conditional=True,
+            etag=True,
+            max_age=0
+        )
+    except NotFound:
         return jsonify({"status": "error", "message": "File not found"}), 404
-    
-    return send_file(
-        file_path,
-        mimetype='application/zip',
-        as_attachment=True,
-        download_name=filename
-    )
+
+
+# Per-modem plot listings keyed by MAC prefix -> (plot dir st_mtime_ns, [path, ...]).
+# Adding or removing a plot bumps the directory mtime and invalidates the entry.
+# Rewriting a plot in place does not, so file mtimes are never cached here.
+_plot_list_cache: Dict[str, tuple] = {}
+_plot_list_lock = threading.Lock()
+PLOT_LIST_CACHE_SIZE = 1024
+
+
+def _list_plot_files(plot_dir: str, mac_clean: str) -> list:
+    """Return unordered paths of a modem's PNG plots (os.scandir + prefix match)."""
+    dir_mtime_ns = os.stat(plot_dir).st_mtime_ns
+    cache_key = f"{plot_dir}/{mac_clean}"
+    cached = _plot_list_cache.get(cache_key)
+    if cached and cached[0] == dir_mtime_ns:
+        return cached[1]
+    
+    with os.scandir(plot_dir) as it:
+        plot_files = [entry.path for entry in it
+                      if entry.name.startswith(mac_clean) and entry.name.endswith('.png')]
+    
+    with _plot_list_lock:
+        if cache_key not in _plot_list_cache and len(_plot_list_cache) >= PLOT_LIST_CACHE_SIZE:
+            _plot_list_cache.pop(next(iter(_plot_list_cache)))
+        _plot_list_cache[cache_key] = (dir_mtime_ns, plot_files)
+    return plot_files
+
+
+def _newest_plot_files(plot_dir: str, mac_clean: str, limit: int,
+                       since_ns: int = 0, contains: str = None) -> list:
+    """Return up to limit [(path, st_mtime_ns)] newest first, optionally filtered."""
+    # Stat each candidate now: a plot still being written keeps its name but not its mtime
+    candidates = []
+    for path in _list_plot_files(plot_dir, mac_clean):
+        if contains is not None and contains not in path:
+            continue
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            continue  # Removed since the listing
+        if mtime_ns > since_ns:
+            candidates.append((path, mtime_ns))
+    # O(N log limit) selection instead of sorting the whole listing
+    return heapq.nlargest(limit, candidates, key=itemgetter(1))
 
 
 @pypnm_bp.route('/plots/<mac_address>', methods=['GET'])
@@ -942,52 +1660,78 @@ def get_plots(mac_address):
     Get matplotlib plots generated by PyPNM for a specific modem.
     Plots are stored in PyPNM container at /app/.data/png/
     
-    Returns base64-encoded plot images.
+    Returns plot URLs (served by /api/pypnm/plot_file/<name>).
+    Pass ?inline=1 to get base64-encoded plot images instead.
     """
-    import os
-    import base64
-    import glob
-    from flask import request
-    
     # PyPNM stores plots in /pypnm-data/png/ (mounted volume)
-    plot_dir = "/pypnm-data/png"
+    plot_dir = PLOT_DIR
     timestamp = request.args.get('timestamp')  # Optional filter by timestamp
+    inline = request.args.get('inline') == '1'
     
-    if not os.path.exists(plot_dir):
+    try:
+        dir_mtime_ns = os.stat(plot_dir).st_mtime_ns
+    except OSError:
         return jsonify({
             "status": "error",
             "message": "PyPNM plot directory not accessible. Ensure volume is mounted."
         }), 500
     
-    # Find PNG files for this modem (MAC address in filename)
-    pattern = f"{plot_dir}/{mac_address.replace(':', '')}*.png"
-    plot_files = glob.glob(pattern)
-    
-    if timestamp:
-        plot_files = [f for f in plot_files if timestamp in f]
-    
-    # Sort by modification time (newest first) and limit to last 50
-    plot_files.sort(key=os.path.getmtime, reverse=True)
-    plot_files = plot_files[:50]
+    # Find PNG files for this modem (MAC address in filename), newest 50 first
+    plot_files = _newest_plot_files(plot_dir, _norm_mac(mac_address), 50, contains=timestamp or None)
+    
+    # New plots bump the directory mtime and rewritten plots their own mtime;
+    # idle pollers get a 304 without reading or encoding anything. The ETag
+    # carries full ns precision since Last-Modified only has one-second resolution.
+    # It is weak: _gzip_json may send the same plots with or without compression.
+    newest_ns = max(dir_mtime_ns, plot_files[0][1] if plot_files else 0)
+    etag = f"plots-{dir_mtime_ns}-{newest_ns}"
+    last_modified = newest_ns // 1_000_000_000
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains_weak(etag)
+    else:
+        since = request.if_modified_since
+        not_modified = since is not None and last_modified <= since.timestamp()
+    if not_modified:
+        response = Response(status=304)
+        response.set_etag(etag, weak=True)
+        response.headers['Cache-Control'] = 'no-cache, must-revalidate'
+        return response
+    
+    if inline:
+        # Base64 bodies are streamed one plot at a time instead of building one large JSON string
+        response = Response(_stream_inline_plots(plot_files, current_app.json.dumps), mimetype='application/json')
+    else:
+        plots = _plot_refs(plot_files, inline, timestamps=True)
+        response = jsonify({
+            "status": "success",
+            "count": len(plots),
+            "plots": plots
+        })
+    response.set_etag(etag, weak=True)
+    response.last_modified = last_modified
+    response.headers['Cache-Control'] = 'no-cache, must-revalidate'
+    return response
+
+
+@pypnm_bp.route('/plot_file/<path:name>', methods=['GET'])
+def plot_file(name):
+    """
+    Serve a single PyPNM plot PNG from /pypnm-data/png.
     
-    plots = []
-    for filepath in plot_files:
-        try:
-            with open(filepath, 'rb') as f:
-                img_data = f.read()
-                plots.append({
-                    'filename': os.path.basename(filepath),
-                    'data': base64.b64encode(img_data).decode('utf-8'),
-                    'timestamp': os.path.getmtime(filepath)
-                })
-        except Exception as e:
-            logger.error(f"Failed to read plot {filepath}: {e}")
+    GET /api/pypnm/plot_file/<name>
+    """
+    # send_from_directory rejects paths escaping plot_dir and supports 304/Range
+    return send_from_directory(PLOT_DIR, name, mimetype='image/png', conditional=True)
+
+
+@pypnm_bp.route('/archive_plot/<path:name>', methods=['GET'])
+def archive_plot_file(name):
+    """
+    Serve a plot PNG extracted from a measurement archive.
     
-    return jsonify({
-        "status": "success",
-        "count": len(plots),
-        "plots": plots
-    })
+    GET /api/pypnm/archive_plot/<archive>/<name>
+    """
+    return send_from_directory(ARCHIVE_PLOT_DIR, name, mimetype='image/png', conditional=True)
 
 
 # ============== Upstream PNM Routes ==============
@@ -1016,16 +1760,15 @@ def discover_rf_port(mac_address):
     from app.core.utsc_discovery import discover_rf_port_for_modem
     
     data = request.get_json() or {}
-    cmts_ip = data.get('cmts_ip')
-    community = data.get('community', get_cmts_community())  # Default write community
-    
-    if not cmts_ip:
-        return jsonify({"success": False, "error": "cmts_ip required"}), 400
+    try:
+        req = UpstreamRequest.parse(data, 'cmts_ip')
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
     
-    logger.info(f"Fast RF port discovery for {mac_address} on CMTS {cmts_ip}")
+    logger.info(f"Fast RF port discovery for {mac_address} on CMTS {req.cmts_ip}")
     
     try:
-        result = discover_rf_port_for_modem(cmts_ip, community, mac_address)
+        result = discover_rf_port_for_modem(req.cmts_ip, req.community, mac_address)
         
         if result["success"]:
             return jsonify(result)
@@ -1037,6 +1780,45 @@ def discover_rf_port(mac_address):
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+def _run_agent_task(capabilities: tuple, command: str, params: Dict[str, Any],
+                    no_agent_message: str, wait: float = 60):
+    """
+    Run command on the first agent offering one of capabilities and wait for it.
+    
+    Returns (task_result, None) on success, else (None, error_response) with a
+    503 (no agent), 504 (timed out) or 500 (agent reported an error).
+    """
+    from app.core.simple_ws import get_simple_agent_manager
+    
+    agent_manager = get_simple_agent_manager()
+    agent = None
+    if agent_manager:
+        for capability in capabilities:
+            agent = agent_manager.get_agent_for_capability(capability)
+            if agent:
+                break
+    
+    if not agent:
+        return None, (jsonify({"status": "error", "message": no_agent_message}), 503)
+    
+    task_id = agent_manager.send_task_sync(
+        agent_id=agent.agent_id,
+        command=command,
+        params=params,
+        timeout=60
+    )
+    
+    result = agent_manager.wait_for_task(task_id, timeout=wait)
+    
+    if result is None:
+        return None, (jsonify({"status": "error", "message": "Task timed out"}), 504)
+    
+    if result.get('error'):
+        return None, (jsonify({"status": "error", "message": result.get('error')}), 500)
+    
+    return result.get('result', {}), None
+
+
 @pypnm_bp.route('/upstream/interfaces/<mac_address>', methods=['POST'])
 def get_upstream_interfaces(mac_address):
     """
@@ -1049,51 +1831,30 @@ def get_upstream_interfaces(mac_address):
         "community": "optional"
     }
     """
-    from app.core.simple_ws import get_simple_agent_manager
-    
     data = request.get_json() or {}
-    cmts_ip = data.get('cmts_ip')
-    community = data.get('community', get_cmts_community())
-    
-    if not cmts_ip:
-        return jsonify({"status": "error", "message": "cmts_ip required"}), 400
+    try:
+        req = UpstreamRequest.parse(data, 'cmts_ip')
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
     
     try:
-        agent_manager = get_simple_agent_manager()
-        agent = agent_manager.get_agent_for_capability('pnm_us_get_interfaces') if agent_manager else None
-        
-        if not agent:
-            # Fallback to any CMTS-capable agent
-            agent = agent_manager.get_agent_for_capability('cmts_snmp_direct') if agent_manager else None
-        
-        if not agent:
-            return jsonify({"status": "error", "message": "No agent available for upstream interface discovery"}), 503
-        
-        task_id = agent_manager.send_task_sync(
-            agent_id=agent.agent_id,
-            command='pnm_us_get_interfaces',
-            params={
-                "cmts_ip": cmts_ip,
+        # Fall back to any CMTS-capable agent
+        task_result, error = _run_agent_task(
+            ('pnm_us_get_interfaces', 'cmts_snmp_direct'), 'pnm_us_get_interfaces',
+            {
+                "cmts_ip": req.cmts_ip,
                 "cm_mac_address": mac_address,
-                "community": community
+                "community": req.community
             },
-            timeout=60
+            "No agent available for upstream interface discovery", wait=90
         )
-        
-        result = agent_manager.wait_for_task(task_id, timeout=90)
-        
-        if result is None:
-            return jsonify({"status": "error", "message": "Task timed out"}), 504
-        
-        if result.get('error'):
-            return jsonify({"status": "error", "message": result.get('error')}), 500
-        
-        task_result = result.get('result', {})
+        if error:
+            return error
         
         return jsonify({
             "success": task_result.get('success', False),
             "mac_address": mac_address,
-            "cmts_ip": cmts_ip,
+            "cmts_ip": req.cmts_ip,
             "cm_index": task_result.get('cm_index'),
             "rf_ports": task_result.get('rf_ports', []),  # Modem's specific RF port(s)
             "all_rf_ports": task_result.get('all_rf_ports', []),  # All us-conn ports
@@ -1136,27 +1897,26 @@ def discover_modem_ofdma(mac_address):
         return jsonify({"success": False, "error": "PyPNM not available"}), 503
     
     data = request.get_json() or {}
-    cmts_ip = data.get('cmts_ip')
-    community = data.get('community', get_cmts_community())
-    
-    if not cmts_ip:
-        return jsonify({"success": False, "error": "cmts_ip required"}), 400
+    try:
+        req = UpstreamRequest.parse(data, 'cmts_ip')
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
     
     try:
-        result = discover_modem_ofdma_sync(cmts_ip, mac_address, community)
+        result = discover_modem_ofdma_sync(req.cmts_ip, mac_address, req.community)
         
         if result.get("success"):
             return jsonify({
                 "success": True,
                 "mac_address": mac_address,
-                "cmts_ip": cmts_ip,
+                "cmts_ip": req.cmts_ip,
                 **result
             })
         else:
             return jsonify({
                 "success": False,
                 "mac_address": mac_address,
-                "cmts_ip": cmts_ip,
+                "cmts_ip": req.cmts_ip,
                 "error": result.get("error", "Discovery failed")
             }), 404
             
@@ -1185,20 +1945,18 @@ def start_cmts_us_rxmer(mac_address):
         return jsonify({"success": False, "error": "PyPNM not available"}), 503
     
     data = request.get_json() or {}
-    cmts_ip = data.get('cmts_ip')
-    ofdma_ifindex = data.get('ofdma_ifindex')
-    community = data.get('community', get_cmts_community())
-    
-    if not cmts_ip or not ofdma_ifindex:
-        return jsonify({"success": False, "error": "cmts_ip and ofdma_ifindex required"}), 400
+    try:
+        req = UpstreamRequest.parse(data, 'cmts_ip', 'ofdma_ifindex')
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
     
     try:
         config = UsOfdmaRxMerConfig(
-            cmts_ip=cmts_ip,
-            ofdma_ifindex=ofdma_ifindex,
+            cmts_ip=req.cmts_ip,
+            ofdma_ifindex=req.ofdma_ifindex,
             cm_mac_address=mac_address,
-            community=community,
-            filename=data.get('filename', f'usrxmer_{mac_address.replace(":", "")}'),
+            community=req.community,
+            filename=data.get('filename', f'usrxmer_{_norm_mac(mac_address)}'),
             pre_eq=data.get('pre_eq', True),
             num_averages=data.get('num_averages', 1)
         )
@@ -1233,15 +1991,13 @@ def get_cmts_us_rxmer_status(mac_address):
         return jsonify({"success": False, "error": "PyPNM not available"}), 503
     
     data = request.get_json() or {}
-    cmts_ip = data.get('cmts_ip')
-    ofdma_ifindex = data.get('ofdma_ifindex')
-    community = data.get('community', get_cmts_community())
-    
-    if not cmts_ip or not ofdma_ifindex:
-        return jsonify({"success": False, "error": "cmts_ip and ofdma_ifindex required"}), 400
+    try:
+        req = UpstreamRequest.parse(data, 'cmts_ip', 'ofdma_ifindex')
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
     
     try:
-        result = get_us_rxmer_status_sync(cmts_ip, ofdma_ifindex, community)
+        result = get_us_rxmer_status_sync(req.cmts_ip, req.ofdma_ifindex, req.community)
         
         logger.info(f"US RxMER status response from PyPNM: {result}")
         
@@ -1338,51 +2094,47 @@ def configure_utsc(mac_address):
         "tftp_ip": "optional"
     }
     """
-    from app.core.pypnm_client import PyPNMClient
-    
     logger.info(f"=== UTSC CONFIGURE START === MAC: {mac_address}")
-    logger.info(f"Request headers: {dict(request.headers)}")
-    logger.info(f"Request data: {request.data}")
-    logger.info(f"Request content_type: {request.content_type}")
+    # Header/body dumps are only built when debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("UTSC request headers=%s content_type=%s data=%r",
+                     dict(request.headers), request.content_type, request.data)
     
     data = request.get_json() or {}
-    logger.info(f"Parsed JSON data: {data}")
-    
-    cmts_ip = data.get('cmts_ip')
-    rf_port_ifindex = data.get('rf_port_ifindex')
-    community = data.get('community', get_cmts_community())  # UTSC needs CMTS write community
-    tftp_ip = data.get('tftp_ip', get_default_tftp())
     
-    logger.info(f"Extracted params: cmts_ip={cmts_ip}, rf_port={rf_port_ifindex}, community={community}")
+    try:
+        req = UpstreamRequest.parse(data, 'cmts_ip', 'rf_port_ifindex')
+    except ValueError as e:
+        logger.error(f"Invalid UTSC params: {e}")
+        return jsonify({"status": "error", "message": str(e)}), 400
+    tftp_ip = data['tftp_ip'] if 'tftp_ip' in data else get_default_tftp()
     
-    if not cmts_ip or not rf_port_ifindex:
-        logger.error(f"Missing required params! cmts_ip={cmts_ip}, rf_port={rf_port_ifindex}")
-        return jsonify({"status": "error", "message": "cmts_ip and rf_port_ifindex required"}), 400
+    logger.info(f"Extracted params: cmts_ip={req.cmts_ip}, rf_port={req.rf_port_ifindex}, community={req.community}")
     
     try:
-        client = PyPNMClient()
+        client = get_pypnm_client()
         
         trigger_mode = data.get('trigger_mode', 2)
         cm_mac = mac_address if trigger_mode == 6 else None
         
         result = client.get_upstream_spectrum_capture(
-            cmts_ip=cmts_ip,
-            rf_port_ifindex=rf_port_ifindex,
+            cmts_ip=req.cmts_ip,
+            rf_port_ifindex=req.rf_port_ifindex,
             tftp_ipv4=tftp_ip,
-            community=community,
+            community=req.community,
             output_type='json',
             trigger_mode=trigger_mode,
             center_freq_hz=data.get('center_freq_hz', 30000000),
             span_hz=data.get('span_hz', 80000000),
             num_bins=data.get('num_bins', 800),
-            filename=data.get('filename', f'utsc_{mac_address.replace(":", "")}'),
+            filename=data.get('filename', f'utsc_{_norm_mac(mac_address)}'),
             cm_mac=cm_mac,
             logical_ch_ifindex=data.get('logical_ch_ifindex'),
             repeat_period_ms=data.get('repeat_period_ms', 3000),
             freerun_duration_ms=data.get('freerun_duration_ms', 300000),  # Default 5 minutes
             trigger_count=data.get('trigger_count') if 'trigger_count' in data else None  # Only set if explicitly provided
         )
-        logger.info(f"UTSC API full response: {result}")
+        logger.debug("UTSC API full response: %s", result)
         return jsonify({
             "success": result.get('success', False),
             "mac_address": mac_address,
@@ -1404,9 +2156,6 @@ def start_utsc(mac_address):
     Start UTSC test on CMTS - calls configure_utsc with same request data.
     """
     logger.info(f"=== START_UTSC CALLED === MAC: {mac_address}")
-    logger.info(f"Request object: {request}")
-    logger.info(f"Request data in start_utsc: {request.data}")
-    logger.info(f"Request JSON in start_utsc: {request.get_json()}")
     # Call configure_utsc which handles the full flow
     return configure_utsc(mac_address)
 
@@ -1414,43 +2163,24 @@ def start_utsc(mac_address):
 @pypnm_bp.route('/upstream/utsc/stop/<mac_address>', methods=['POST'])
 def stop_utsc(mac_address):
     """Stop UTSC test on CMTS."""
-    from app.core.simple_ws import get_simple_agent_manager
-    
     data = request.get_json() or {}
-    cmts_ip = data.get('cmts_ip')
-    rf_port_ifindex = data.get('rf_port_ifindex')
-    community = data.get('community', get_cmts_community())
-    
-    if not cmts_ip or not rf_port_ifindex:
-        return jsonify({"status": "error", "message": "cmts_ip and rf_port_ifindex required"}), 400
+    try:
+        req = UpstreamRequest.parse(data, 'cmts_ip', 'rf_port_ifindex')
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
     
     try:
-        agent_manager = get_simple_agent_manager()
-        agent = agent_manager.get_agent_for_capability('pnm_utsc_stop') if agent_manager else None
-        
-        if not agent:
-            return jsonify({"status": "error", "message": "No agent available for UTSC"}), 503
-        
-        task_id = agent_manager.send_task_sync(
-            agent_id=agent.agent_id,
-            command='pnm_utsc_stop',
-            params={
-                "cmts_ip": cmts_ip,
-                "rf_port_ifindex": rf_port_ifindex,
-                "community": community
+        task_result, error = _run_agent_task(
+            ('pnm_utsc_stop',), 'pnm_utsc_stop',
+            {
+                "cmts_ip": req.cmts_ip,
+                "rf_port_ifindex": req.rf_port_ifindex,
+                "community": req.community
             },
-            timeout=60
+            "No agent available for UTSC"
         )
-        
-        result = agent_manager.wait_for_task(task_id, timeout=60)
-        
-        if result is None:
-            return jsonify({"status": "error", "message": "Task timed out"}), 504
-        
-        if result.get('error'):
-            return jsonify({"status": "error", "message": result.get('error')}), 500
-        
-        task_result = result.get('result', {})
+        if error:
+            return error
         
         return jsonify({
             "success": task_result.get('success', False),
@@ -1470,43 +2200,24 @@ def get_utsc_status(mac_address):
     Returns:
     - meas_status: 1=other, 2=inactive, 3=busy, 4=sampleReady, 5=error
     """
-    from app.core.simple_ws import get_simple_agent_manager
-    
     data = request.get_json() or {}
-    cmts_ip = data.get('cmts_ip')
-    rf_port_ifindex = data.get('rf_port_ifindex')
-    community = data.get('community', get_cmts_community())
-    
-    if not cmts_ip or not rf_port_ifindex:
-        return jsonify({"status": "error", "message": "cmts_ip and rf_port_ifindex required"}), 400
+    try:
+        req = UpstreamRequest.parse(data, 'cmts_ip', 'rf_port_ifindex')
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
     
     try:
-        agent_manager = get_simple_agent_manager()
-        agent = agent_manager.get_agent_for_capability('pnm_utsc_status') if agent_manager else None
-        
-        if not agent:
-            return jsonify({"status": "error", "message": "No agent available for UTSC"}), 503
-        
-        task_id = agent_manager.send_task_sync(
-            agent_id=agent.agent_id,
-            command='pnm_utsc_status',
-            params={
-                "cmts_ip": cmts_ip,
-                "rf_port_ifindex": rf_port_ifindex,
-                "community": community
+        task_result, error = _run_agent_task(
+            ('pnm_utsc_status',), 'pnm_utsc_status',
+            {
+                "cmts_ip": req.cmts_ip,
+                "rf_port_ifindex": req.rf_port_ifindex,
+                "community": req.community
             },
-            timeout=60
+            "No agent available for UTSC"
         )
-        
-        result = agent_manager.wait_for_task(task_id, timeout=60)
-        
-        if result is None:
-            return jsonify({"status": "error", "message": "Task timed out"}), 504
-        
-        if result.get('error'):
-            return jsonify({"status": "error", "message": result.get('error')}), 500
-        
-        task_result = result.get('result', {})
+        if error:
+            return error
         
         return jsonify({
             "success": task_result.get('success', False),
@@ -1533,46 +2244,27 @@ def start_us_rxmer(mac_address):
         "community": "optional"
     }
     """
-    from app.core.simple_ws import get_simple_agent_manager
-    
     data = request.get_json() or {}
-    cmts_ip = data.get('cmts_ip')
-    ofdma_ifindex = data.get('ofdma_ifindex')
-    community = data.get('community', get_cmts_community())
-    
-    if not cmts_ip or not ofdma_ifindex:
-        return jsonify({"status": "error", "message": "cmts_ip and ofdma_ifindex required"}), 400
+    try:
+        req = UpstreamRequest.parse(data, 'cmts_ip', 'ofdma_ifindex')
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
     
     try:
-        agent_manager = get_simple_agent_manager()
-        agent = agent_manager.get_agent_for_capability('pnm_us_rxmer_start') if agent_manager else None
-        
-        if not agent:
-            return jsonify({"status": "error", "message": "No agent available for US RxMER"}), 503
-        
-        task_id = agent_manager.send_task_sync(
-            agent_id=agent.agent_id,
-            command='pnm_us_rxmer_start',
-            params={
-                "cmts_ip": cmts_ip,
-                "ofdma_ifindex": ofdma_ifindex,
+        task_result, error = _run_agent_task(
+            ('pnm_us_rxmer_start',), 'pnm_us_rxmer_start',
+            {
+                "cmts_ip": req.cmts_ip,
+                "ofdma_ifindex": req.ofdma_ifindex,
                 "cm_mac_address": mac_address,
                 "pre_eq": data.get('pre_eq', True),
-                "filename": data.get('filename', f'usrxmer_{mac_address.replace(":", "")}'),
-                "community": community
+                "filename": data.get('filename', f'usrxmer_{_norm_mac(mac_address)}'),
+                "community": req.community
             },
-            timeout=60
+            "No agent available for US RxMER"
         )
-        
-        result = agent_manager.wait_for_task(task_id, timeout=60)
-        
-        if result is None:
-            return jsonify({"status": "error", "message": "Task timed out"}), 504
-        
-        if result.get('error'):
-            return jsonify({"status": "error", "message": result.get('error')}), 500
-        
-        task_result = result.get('result', {})
+        if error:
+            return error
         
         # Extract filename from result - PyPNM returns it in the result
         response = {
@@ -1594,43 +2286,24 @@ def start_us_rxmer(mac_address):
 @pypnm_bp.route('/upstream/rxmer/status/<mac_address>', methods=['POST'])
 def get_us_rxmer_status(mac_address):
     """Get Upstream RxMER measurement status."""
-    from app.core.simple_ws import get_simple_agent_manager
-    
     data = request.get_json() or {}
-    cmts_ip = data.get('cmts_ip')
-    ofdma_ifindex = data.get('ofdma_ifindex')
-    community = data.get('community', get_cmts_community())
-    
-    if not cmts_ip or not ofdma_ifindex:
-        return jsonify({"status": "error", "message": "cmts_ip and ofdma_ifindex required"}), 400
+    try:
+        req = UpstreamRequest.parse(data, 'cmts_ip', 'ofdma_ifindex')
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
     
     try:
-        agent_manager = get_simple_agent_manager()
-        agent = agent_manager.get_agent_for_capability('pnm_us_rxmer_status') if agent_manager else None
-        
-        if not agent:
-            return jsonify({"status": "error", "message": "No agent available for US RxMER"}), 503
-        
-        task_id = agent_manager.send_task_sync(
-            agent_id=agent.agent_id,
-            command='pnm_us_rxmer_status',
-            params={
-                "cmts_ip": cmts_ip,
-                "ofdma_ifindex": ofdma_ifindex,
-                "community": community
+        task_result, error = _run_agent_task(
+            ('pnm_us_rxmer_status',), 'pnm_us_rxmer_status',
+            {
+                "cmts_ip": req.cmts_ip,
+                "ofdma_ifindex": req.ofdma_ifindex,
+                "community": req.community
             },
-            timeout=60
+            "No agent available for US RxMER"
         )
-        
-        result = agent_manager.wait_for_task(task_id, timeout=60)
-        
-        if result is None:
-            return jsonify({"status": "error", "message": "Task timed out"}), 504
-        
-        if result.get('error'):
-            return jsonify({"status": "error", "message": result.get('error')}), 500
-        
-        task_result = result.get('result', {})
+        if error:
+            return error
         
         return jsonify({
             "success": task_result.get('success', False),
@@ -1643,6 +2316,120 @@ def get_us_rxmer_status(mac_address):
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
+# Agent commands allowed in a status batch, with their wait timeouts (seconds).
+# Each command may appear once per batch, so this also bounds the batch size
+AGENT_BATCH_COMMANDS = {
+    'pnm_us_get_interfaces': 90,
+    'pnm_utsc_status': 60,
+    'pnm_us_rxmer_status': 60,
+}
+
+# Capabilities to look for per batch command, same fallbacks as the single endpoints
+AGENT_BATCH_CAPABILITIES = {
+    'pnm_us_get_interfaces': ('pnm_us_get_interfaces', 'cmts_snmp_direct'),
+}
+
+
+@pypnm_bp.route('/upstream/status_batch/<mac_address>', methods=['POST'])
+def upstream_status_batch(mac_address):
+    """
+    Run several read-only agent tasks for a modem concurrently.
+    
+    All tasks are sent first and then awaited in parallel, so the latency is
+    that of the slowest task instead of the sum of all of them.
+    
+    POST body:
+    {
+        "tasks": [
+            {"cmd": "pnm_utsc_status", "params": {"cmts_ip": "x.x.x.x", "rf_port_ifindex": 12345}},
+            {"cmd": "pnm_us_rxmer_status", "params": {"cmts_ip": "x.x.x.x", "ofdma_ifindex": 12345}}
+        ]
+    }
+    
+    Each command may appear once; returns results keyed by command, each
+    shaped like the single-task endpoint.
+    """
+    from app.core.simple_ws import get_simple_agent_manager
+    
+    data = request.get_json() or {}
+    tasks = data.get('tasks') if isinstance(data, dict) else None
+    
+    if not tasks:
+        return jsonify({"status": "error", "message": "tasks required"}), 400
+    
+    if not isinstance(tasks, list) or not all(
+        isinstance(t, dict) and isinstance(t.get('params') or {}, dict) for t in tasks
+    ):
+        return jsonify({"status": "error", "message": "tasks must be a list of {cmd, params} objects"}), 400
+    
+    cmds = [t.get('cmd') for t in tasks]
+    unknown = [cmd for cmd in cmds if cmd not in AGENT_BATCH_COMMANDS]
+    if unknown:
+        return jsonify({"status": "error", "message": f"Unsupported batch commands: {unknown}"}), 400
+    
+    # Results are keyed by command
+    if len(set(cmds)) != len(cmds):
+        return jsonify({"status": "error", "message": "Each command may appear only once per batch"}), 400
+    
+    try:
+        agent_manager = get_simple_agent_manager()
+        if not agent_manager:
+            return jsonify({"status": "error", "message": "No agent available"}), 503
+        
+        results = {}
+        pending = []
+        for task in tasks:
+            cmd = task['cmd']
+            agent = None
+            for capability in AGENT_BATCH_CAPABILITIES.get(cmd, (cmd,)):
+                agent = agent_manager.get_agent_for_capability(capability)
+                if agent:
+                    break
+            if not agent:
+                results[cmd] = {"status": "error", "message": f"No agent available for {cmd}"}
+                continue
+            
+            params = {"community": get_cmts_community(), **(task.get('params') or {})}
+            if cmd == 'pnm_us_get_interfaces':
+                params.setdefault('cm_mac_address', mac_address)
+            
+            task_id = agent_manager.send_task_sync(
+                agent_id=agent.agent_id,
+                command=cmd,
+                params=params,
+                timeout=AGENT_BATCH_COMMANDS[cmd]
+            )
+            pending.append((cmd, task_id))
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+                futures = [
+                    (cmd, pool.submit(agent_manager.wait_for_task, task_id, timeout=AGENT_BATCH_COMMANDS[cmd]))
+                    for cmd, task_id in pending
+                ]
+                for cmd, future in futures:
+                    result = future.result()
+                    if result is None:
+                        results[cmd] = {"status": "error", "message": "Task timed out"}
+                    elif result.get('error'):
+                        results[cmd] = {"status": "error", "message": result.get('error')}
+                    else:
+                        task_result = result.get('result', {})
+                        results[cmd] = {
+                            "success": task_result.get('success', False),
+                            **task_result
+                        }
+        
+        return jsonify({
+            "mac_address": mac_address,
+            "results": results
+        })
+    
+    except Exception as e:
+        logger.error(f"Upstream status batch failed: {e}")
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+
 @pypnm_bp.route('/upstream/utsc/data/<mac_address>', methods=['POST'])
 def get_utsc_data(mac_address):
     """
@@ -1658,13 +2445,9 @@ def get_utsc_data(mac_address):
     
     Returns spectrum data with frequencies and amplitudes for graphing.
     """
-    import glob
-    import os
-    import struct
-    
     data = request.get_json() or {}
     cmts_ip = data.get('cmts_ip')
-    filename_base = data.get('filename', f'utsc_{mac_address.replace(":", "")}')
+    filename_base = data.get('filename', f'utsc_{_norm_mac(mac_address)}')
     
     if not cmts_ip:
         return jsonify({"status": "error", "message": "cmts_ip required"}), 400
@@ -1673,21 +2456,26 @@ def get_utsc_data(mac_address):
         # TFTP files are mounted at /var/lib/tftpboot
         tftp_base = '/var/lib/tftpboot'
         
-        # Find the most recent UTSC file matching the pattern
-        pattern = f"{tftp_base}/{filename_base}_*"
-        files = sorted(glob.glob(pattern), reverse=True)
+        # Find the most recent UTSC file: names end in a timestamp, so the
+        # lexically largest match is the newest (single scandir pass, no sort)
+        prefix = f"{filename_base}_"
+        try:
+            with os.scandir(tftp_base) as it:
+                latest_name = max((entry.name for entry in it if entry.name.startswith(prefix)), default=None)
+        except FileNotFoundError:
+            latest_name = None
         
-        if not files:
+        if latest_name is None:
             # No files yet - return empty result (not an error)
             logger.info(f"No UTSC files found yet for {filename_base}")
             return jsonify({
                 "success": True,
                 "message": "No UTSC data available yet. Start a measurement to begin.",
                 "data": None
-            }), 200
+            })
         
         # Get the most recent file
-        latest_file = files[0]
+        latest_file = os.path.join(tftp_base, latest_name)
         logger.info(f"Reading UTSC file: {latest_file}")
         
         # Read the binary file
@@ -1703,7 +2491,7 @@ def get_utsc_data(mac_address):
         # Retrieve UTSC config from Redis FIRST to get correct span
         utsc_config = {}
         try:
-            config_json = redis_client.get(f'utsc_config:{mac_address}')
+            config_json = _redis_call('get', f'utsc_config:{mac_address}')
             if config_json:
                 utsc_config = json.loads(config_json)
                 logger.info(f"Retrieved UTSC config: {utsc_config}")
@@ -1717,12 +2505,8 @@ def get_utsc_data(mac_address):
         
         # Convert binary samples to amplitude values (simplified)
         # Real implementation needs proper DOCSIS OSSIv4.0 parsing
-        amplitudes = []
-        for i in range(0, len(samples), 2):
-            if i+1 < len(samples):
-                # Each sample is 2 bytes (int16)
-                val = struct.unpack('<h', samples[i:i+2])[0]
-                amplitudes.append(val / 100.0)  # Scale to dB
+        # Each sample is 2 bytes (little-endian int16), scaled to dB in one pass
+        amplitudes = np.frombuffer(samples, dtype='<i2', count=len(samples) // 2) / 100.0
         
         # Generate frequencies using configured span (defaults: 5-85 MHz = 80 MHz span, center 45 MHz)
         num_bins = len(amplitudes)
@@ -1731,15 +2515,16 @@ def get_utsc_data(mac_address):
         freq_start = center_freq_hz - (span_hz / 2)
         freq_end = center_freq_hz + (span_hz / 2)
         freq_step = span_hz / num_bins if num_bins > 0 else 1
-        frequencies = [freq_start + i * freq_step for i in range(num_bins)]
+        # Only the first 800 points are returned
+        frequencies = freq_start + np.arange(min(num_bins, 800)) * freq_step
         
         logger.info(f"UTSC freq range: {freq_start/1e6:.1f} - {freq_end/1e6:.1f} MHz, {num_bins} bins")
         
         spectrum_data = {
             'filename': os.path.basename(latest_file),
             'num_samples': len(amplitudes),
-            'frequencies': frequencies[:800],  # Limit to first 800 points
-            'amplitudes': amplitudes[:800],
+            'frequencies': frequencies.tolist(),  # Limit to first 800 points
+            'amplitudes': amplitudes[:800].tolist(),
             'span_hz': span_hz,
             'center_freq_hz': center_freq_hz,
             'num_bins': num_bins
@@ -1777,17 +2562,16 @@ def get_us_rxmer_data(mac_address):
         "community": "optional"
     }
     
-    Returns RxMER per subcarrier for graphing.
+    Returns 202 with a task_id right away; the RxMER per subcarrier for
+    graphing is fetched from GET /task/<task_id> once the agent is done.
     """
     from app.core.simple_ws import get_simple_agent_manager
     
     data = request.get_json() or {}
-    cmts_ip = data.get('cmts_ip')
-    ofdma_ifindex = data.get('ofdma_ifindex')
-    community = data.get('community', get_cmts_community())
-    
-    if not cmts_ip:
-        return jsonify({"status": "error", "message": "cmts_ip required"}), 400
+    try:
+        req = UpstreamRequest.parse(data, 'cmts_ip')
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
     
     try:
         agent_manager = get_simple_agent_manager()
@@ -1800,35 +2584,65 @@ def get_us_rxmer_data(mac_address):
             agent_id=agent.agent_id,
             command='pnm_us_rxmer_data',
             params={
-                "cmts_ip": cmts_ip,
-                "ofdma_ifindex": ofdma_ifindex,
+                "cmts_ip": req.cmts_ip,
+                "ofdma_ifindex": req.ofdma_ifindex,
                 "filename": data.get('filename'),
-                "community": community
+                "community": req.community
             },
             timeout=120
         )
         
-        result = agent_manager.wait_for_task(task_id, timeout=120)
-        
-        if result is None:
-            return jsonify({"status": "error", "message": "Task timed out"}), 504
-        
-        if result.get('error'):
-            return jsonify({"status": "error", "message": result.get('error')}), 500
-        
-        task_result = result.get('result', {})
-        
         return jsonify({
-            "success": task_result.get('success', False),
+            "status": "pending",
             "mac_address": mac_address,
-            **task_result
-        })
+            "task_id": task_id,
+            "poll_url": url_for('pypnm.get_task_result', task_id=task_id)
+        }), 202
         
     except Exception as e:
         logger.error(f"Get US RxMER data failed: {e}")
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
+@pypnm_bp.route('/task/<task_id>', methods=['GET'])
+def get_task_result(task_id):
+    """
+    Long-poll the result of an agent task started by an async endpoint.
+    
+    Query params:
+        wait: seconds to block for the result (default 25, max 30)
+    
+    Returns 202 while the task is still running, the task result once it
+    completed (handed out once), or 404 for unknown or expired tasks.
+    """
+    from app.core.simple_ws import get_simple_agent_manager
+    
+    agent_manager = get_simple_agent_manager()
+    if not agent_manager or task_id not in agent_manager.pending_tasks:
+        return jsonify({"status": "error", "message": "Unknown or expired task"}), 404
+    
+    try:
+        wait = min(max(float(request.args.get('wait', 25)), 0.0), 30.0)
+    except ValueError:
+        return jsonify({"status": "error", "message": "wait must be a number"}), 400
+    
+    result = agent_manager.poll_task(task_id, timeout=wait)
+    
+    if result is None:
+        return jsonify({"status": "pending", "task_id": task_id}), 202
+    
+    if result.get('error'):
+        return jsonify({"status": "error", "task_id": task_id, "message": result.get('error')}), 500
+    
+    task_result = result.get('result', {})
+    
+    return jsonify({
+        "success": task_result.get('success', False),
+        "task_id": task_id,
+        **task_result
+    })
+
+
 @pypnm_bp.route('/upstream/rxmer/plot/<mac_address>', methods=['POST'])
 def get_us_rxmer_plot(mac_address):
     """
@@ -1841,8 +2655,6 @@ def get_us_rxmer_plot(mac_address):
     
     Returns PNG image of the RxMER spectrum.
     """
-    import requests
-    from flask import Response as FlaskResponse
     from app.core.cmts_pnm import get_pypnm_api_url
     
     data = request.get_json() or {}
@@ -1872,11 +2684,11 @@ def get_us_rxmer_plot(mac_address):
         if response.status_code == 200 and response.headers.get('Content-Type', '').startswith('image/'):
             # Return the PNG image directly
             logger.info(f"Successfully fetched US RxMER plot for {mac_address}, size: {len(response.content)} bytes")
-            return FlaskResponse(
+            return Response(
                 response.content,
                 mimetype='image/png',
                 headers={
-                    'Content-Disposition': f'inline; filename=us_rxmer_{mac_address.replace(":", "")}.png'
+                    'Content-Disposition': f'inline; filename=us_rxmer_{_norm_mac(mac_address)}.png'
                 }
             )
         else:
@@ -1904,9 +2716,6 @@ def get_us_rxmer_plot(mac_address):
 def cleanup_old_files():
     """Clean up old PNM measurement files."""
     try:
-        import glob
-        import time
-        
         # Clean up temp files older than 1 hour
         temp_dir = tempfile.gettempdir()
         cleanup_count = 0
@@ -1916,14 +2725,18 @@ def cleanup_old_files():
         patterns = ['*_rxmer*.png', '*_spectrum*.png', '*_channel*.png', '*_modulation*.png', 
                    '*.csv', 'pnm_*.zip']
         
-        for pattern in patterns:
-            for filepath in glob.glob(os.path.join(temp_dir, pattern)):
+        # Single scandir pass; statx fetches only type/size/mtime for the age check
+        with os.scandir(temp_dir) as it:
+            for entry in it:
+                if not any(fnmatch(entry.name, pattern) for pattern in patterns):
+                    continue
                 try:
-                    if os.path.getmtime(filepath) < cutoff_time:
-                        os.remove(filepath)
+                    mtime, _, is_file = stat_mtime_size(entry.path)
+                    if is_file and mtime < cutoff_time:
+                        os.unlink(entry.path)
                         cleanup_count += 1
                 except Exception as e:
-                    logger.warning(f"Failed to delete {filepath}: {e}")
+                    logger.warning(f"Failed to delete {entry.path}: {e}")
         
         logger.info(f"Cleaned up {cleanup_count} old PNM files")
         return jsonify({"success": True, "files_removed": cleanup_count})
@@ -4,12 +4,12 @@
 import logging
 import json
 import time
-import glob
 import os
-import struct
 import threading
 import requests
 from collections import deque
+
+import numpy as np
 from flask import Blueprint, current_app
 
 logger = logging.getLogger(__name__)
@@ -41,6 +41,23 @@ except ImportError:
 _utsc_sessions = {}
 
 
+def scan_utsc_files(tftp_base, mac_clean):
+    """Return [(path, mtime)] for this modem's UTSC captures in one scandir pass."""
+    prefix = f"utsc_{mac_clean}_"
+    files = []
+    try:
+        with os.scandir(tftp_base) as it:
+            for entry in it:
+                if entry.name.startswith(prefix):
+                    try:
+                        files.append((entry.path, entry.stat().st_mtime))
+                    except OSError:
+                        pass  # Removed between listing and stat
+    except OSError as e:
+        logger.warning(f"Could not scan {tftp_base}: {e}")
+    return files
+
+
 def delete_tftp_files(tftp_ip, filenames):
     """Delete files via TFTP."""
     if not TFTP_AVAILABLE:
@@ -280,11 +297,11 @@ def init_websocket(app):
             ftp_pass = current_app.config.get('FTP_PASSWORD', 'ftpaccessftp')
             
             # Look for recent files from this MAC (last 60 seconds)
-            pattern = f"{tftp_base}/utsc_{mac_clean}_*"
-            all_files = glob.glob(pattern)
             current_time = time.time()
-            recent_files = [f for f in all_files if (current_time - os.path.getmtime(f)) < 60]
-            old_files = [f for f in all_files if f not in recent_files]
+            recent_files = []
+            old_files = []
+            for f, mtime in scan_utsc_files(tftp_base, mac_clean):
+                (recent_files if current_time - mtime < 60 else old_files).append(f)
             
             # Delete only OLD files (>60s), keep recent ones
             if old_files:
@@ -322,17 +339,16 @@ def init_websocket(app):
                 elapsed = current_time - connection_start_time
                 
                 # Collect new files continuously - no time limit
-                pattern = f"{tftp_base}/utsc_{mac_clean}_*"
-                files = glob.glob(pattern)
                 # Filter: not processed AND created after stream start
-                new_files = [f for f in files 
-                            if f not in processed_files 
-                            and os.path.getmtime(f) >= stream_start_time]
+                new_files = [(f, mtime) for f, mtime in scan_utsc_files(tftp_base, mac_clean)
+                             if f not in processed_files
+                             and mtime >= stream_start_time]
                 
                 if len(new_files) > 0:
                     logger.info(f"UTSC WebSocket: Found {len(new_files)} new files to process")
                 
-                for filepath in sorted(new_files, key=os.path.getmtime):
+                new_files.sort(key=lambda item: item[1])
+                for filepath, _ in new_files:
                     processed_files.add(filepath)
                     
                     try:
@@ -349,16 +365,10 @@ def init_websocket(app):
                         amp_data = binary_data[328:]
                         num_samples = len(amp_data) // 2
                         
-                        all_amplitudes = []
-                        if num_samples > 0:
-                            try:
-                                # UTSC format: signed 16-bit big-endian, divided by 10.0 for dBmV (0.1 dBmV units)
-                                amplitudes = struct.unpack(f'>{num_samples}h', amp_data[:num_samples * 2])
-                                all_amplitudes = [a / 10.0 for a in amplitudes]
-                            except struct.error as e:
-                                logger.error(f"Error unpacking amplitude data: {e}")
+                        # UTSC format: signed 16-bit big-endian, divided by 10.0 for dBmV (0.1 dBmV units)
+                        all_amplitudes = np.frombuffer(amp_data, dtype='>i2', count=num_samples) / 10.0
                         
-                        if all_amplitudes:
+                        if all_amplitudes.size:
                             # Get center freq and span from Redis or use defaults (80 MHz is E6000-supported)
                             try:
                                 from app import redis_client
@@ -419,7 +429,7 @@ def init_websocket(app):
                     
                     # UTSC amplitudes are normalized/linear (0...1), need to convert to dBmV
                     # Mapping: 0.0 → -60 dBmV, 1.0 → -10 dBmV (realistic upstream PSD range)
-                    raw_amplitudes = [max(-60.0, -60.0 + v * 50.0) for v in amplitudes[:1600]]
+                    raw_amplitudes = np.maximum(-60.0, -60.0 + amplitudes[:1600] * 50.0).tolist()
                     actual_bins = len(raw_amplitudes)
                     
                     # Calculate correct axis: span over actual bins sent
@@ -5,7 +5,10 @@
 import os
 from app import create_app
 
-app = create_app()
+# Spawned plot worker processes re-import this file as __mp_main__;
+# they only need the plotting code, not an app of their own
+if __name__ != '__mp_main__':
+    app = create_app()
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5050))
@@ -2260,7 +2260,8 @@ createApp({
                     payload.sample_duration = 60;
                 }
                 
-                const response = await fetch(`${API_BASE}/pypnm/measurements/${measurementType}/${this.selectedModem.mac_address}`, {
+                // An explicit run always captures anew instead of reusing a cached result
+                const response = await fetch(`${API_BASE}/pypnm/measurements/${measurementType}/${this.selectedModem.mac_address}?nocache=1`, {
                     method: 'POST',
                     headers: { 'Content-Type': 'application/json' },
                     body: JSON.stringify(payload)
@@ -2377,13 +2378,23 @@ createApp({
                     })
                 });
                 
-                const data = await response.json();
+                let data = await response.json();
+                
+                // Housekeeping runs as a background job - poll until it finishes
+                while (data.status === 'running' && data.job_id) {
+                    await new Promise(resolve => setTimeout(resolve, 1000));
+                    const statusResponse = await fetch(`${API_BASE}/pypnm/housekeeping/${data.job_id}`);
+                    data = await statusResponse.json();
+                }
+                
                 this.housekeepingResult = data;
                 
                 if (data.status === 'success') {
                     this.showSuccess(
                         'Housekeeping Complete',
-                        `${this.housekeepingDryRun ? 'Would delete' : 'Deleted'} ${data.deleted_count} files (${data.total_size_mb} MB)`
+                        data.dry_run
+                            ? `Would delete ${data.file_count} files (${data.total_size_mb} MB)`
+                            : `Queued ${data.file_count} files (${data.total_size_mb} MB) for deletion`
                     );
                 } else {
                     this.showError('Housekeeping Failed', data.message);